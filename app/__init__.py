@@ -2,8 +2,59 @@
 Bass Practice Application - Flask App Initialization
 """
 import os
-from flask import Flask
+from flask import Flask, g, request, has_request_context
+from sqlalchemy import event
 from .models import db
+from .config.settings import QUERY_COUNT_WARNING
+
+# Bump when models gain tables or indexes so existing databases are upgraded
+SCHEMA_VERSION = '2'
+
+
+def _initialized_version(marker_path):
+    """Return the schema version recorded in the init marker, or None."""
+    try:
+        with open(marker_path) as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def _merge_duplicate_progress():
+    """Fold duplicate progress rows into the oldest row per category (older databases may hold several)."""
+    from .models import Progress
+    
+    kept = {}
+    for progress in db.session.scalars(db.select(Progress).order_by(Progress.id)).all():
+        keep = kept.setdefault(progress.category, progress)
+        if keep is progress:
+            continue
+        keep.exercises_completed = (keep.exercises_completed or 0) + (progress.exercises_completed or 0)
+        keep.total_practice_time = (keep.total_practice_time or 0) + (progress.total_practice_time or 0)
+        if progress.last_practiced and (not keep.last_practiced or progress.last_practiced > keep.last_practiced):
+            keep.last_practiced = progress.last_practiced
+        keep.update_skill_level()
+        db.session.delete(progress)
+    db.session.commit()
+
+
+def _register_query_counter(app):
+    """Count SQL statements per request, report them in X-Query-Count and log heavy pages."""
+    with app.app_context():
+        engine = db.engine
+    
+    @event.listens_for(engine, 'before_cursor_execute')
+    def count_query(*args):
+        if has_request_context():
+            g.query_count = g.get('query_count', 0) + 1
+    
+    @app.after_request
+    def report_query_count(response):
+        count = g.get('query_count', 0)
+        response.headers['X-Query-Count'] = str(count)
+        if count > QUERY_COUNT_WARNING:
+            app.logger.warning('%s %s issued %d queries', request.method, request.path, count)
+        return response
 
 
 def create_app():
@@ -18,22 +69,38 @@ def create_app():
     os.makedirs(data_dir, exist_ok=True)
     
     app.config['SECRET_KEY'] = 'bass-practice-local-app-secret-key'
-    app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{os.path.join(data_dir, "bass_practice.db")}'
+    db_path = os.path.join(data_dir, 'bass_practice.db')
+    seeded_marker = os.path.join(data_dir, '.seeded')
+    
+    app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{db_path}'
     app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
     
     # Initialize extensions
     db.init_app(app)
+    _register_query_counter(app)
     
     # Register blueprints
     from .routes import register_blueprints
     register_blueprints(app)
     
-    # Create database tables
-    with app.app_context():
-        db.create_all()
+    # Create database tables and seed data, once per data directory and schema version
+    if not (os.path.exists(db_path) and _initialized_version(seeded_marker) == SCHEMA_VERSION):
+        with app.app_context():
+            db.create_all()
+            
+            # Databases from before progress.category was unique may hold duplicates
+            _merge_duplicate_progress()
+            
+            # create_all skips existing tables, so add any indexes they are missing
+            for table in db.metadata.sorted_tables:
+                for index in table.indexes:
+                    index.create(db.engine, checkfirst=True)
+            
+            # Initialize default data if needed
+            from .seed_data import seed_database
+            seed_database()
         
-        # Initialize default data if needed
-        from .seed_data import seed_database
-        seed_database()
+        with open(seeded_marker, 'w') as f:
+            f.write(SCHEMA_VERSION)
     
     return app
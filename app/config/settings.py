@@ -125,3 +125,6 @@ TEMPO_RANGES = {
 APP_NAME = "Bass Practice Pro"
 MASTERY_THRESHOLD = 90.0
 DEFAULT_SESSION_DURATION = 30
+
+# Requests issuing more SQL statements than this are logged as likely N+1 regressions
+QUERY_COUNT_WARNING = 20
@@ -2,16 +2,15 @@
 Dynamic ear training exercise generator for bass guitar practice.
 Generates exercises algorithmically based on music theory.
 """
-import random
-import json
+from random import choice as _choice, randint as _randint, sample as _sample
+from typing import List, NamedTuple
+from .config.settings import NOTES, NOTES_FLAT
+from .utils.music_theory import NOTE_INDEX as _NOTE_INDEX
 
 # =============================================================================
 # MUSIC THEORY CONSTANTS
 # =============================================================================
 
-NOTES = ['C', 'C#', 'D', 'D#', 'E', 'F', 'F#', 'G', 'G#', 'A', 'A#', 'B']
-NOTES_FLAT = ['C', 'Db', 'D', 'Eb', 'E', 'F', 'Gb', 'G', 'Ab', 'A', 'Bb', 'B']
-
 # Intervals (name -> semitones)
 INTERVALS = {
     'm2': 1, 'M2': 2, 'm3': 3, 'M3': 4, 'P4': 5,
@@ -24,6 +23,17 @@ INTERVALS_REVERSE = {
     6: 'tritone', 7: 'P5', 8: 'm6', 9: 'M6', 10: 'm7', 11: 'M7', 12: 'P8'
 }
 
+# Plausible wrong answers for each interval: nearby intervals (common mistakes)
+_WRONG_INTERVAL_OFFSETS = (-2, -1, 1, 2, -3, 3, 5, 7)
+_WRONG_INTERVAL_CANDIDATES = {
+    name: tuple(
+        INTERVALS_REVERSE[semitones + offset]
+        for offset in _WRONG_INTERVAL_OFFSETS
+        if 1 <= semitones + offset <= 12
+    )
+    for name, semitones in INTERVALS.items()
+}
+
 # Chord formulas (intervals from root in semitones)
 CHORD_FORMULAS = {
     'major': [0, 4, 7],
@@ -40,6 +50,8 @@ CHORD_FORMULAS = {
     'minor-major7': [0, 3, 7, 11],
 }
 
+_CHORD_NAMES = tuple(CHORD_FORMULAS)
+
 # Scale degree to semitones mapping
 SCALE_DEGREES = {
     '1': 0, '2': 2, '3': 4, '4': 5, '5': 7, '6': 9, '7': 11, '8': 12,
@@ -53,6 +65,97 @@ SCALE_DEGREES_REVERSE = {
     8: 'b6', 9: '6', 10: 'b7', 11: '7', 12: '8'
 }
 
+# Natural notes used as roots for easier exercises
+_NATURAL_NOTES = tuple(NOTES[:7])
+
+# Answer pools by difficulty tier (1-4)
+_INTERVALS_BY_DIFF = {
+    1: ('m2', 'M2', 'P4', 'P5', 'P8'),
+    2: ('m2', 'M2', 'm3', 'M3', 'P4', 'P5', 'm6', 'M6', 'P8'),
+    3: ('m2', 'M2', 'm3', 'M3', 'P4', 'tritone', 'P5', 'm6', 'M6', 'm7', 'M7', 'P8'),
+    4: tuple(INTERVALS),
+}
+
+_CHORDS_BY_DIFF = {
+    1: ('major', 'minor'),
+    2: ('major', 'minor', 'diminished', 'augmented'),
+    3: ('major', 'minor', 'diminished', 'augmented', 'sus2', 'sus4', 'major7', 'minor7', 'dominant7'),
+    4: _CHORD_NAMES,
+}
+
+# Melody patterns (scale degrees) by difficulty tier
+_MELODY_PATTERNS_BY_DIFF = {
+    # Simple 3-4 note patterns
+    1: (
+        ('1', '3', '5'),
+        ('1', '3', '5', '3'),
+        ('1', '5', '3', '1'),
+    ),
+    # Simple arpeggio-based patterns
+    2: (
+        ('1', '3', '5', '3'),
+        ('1', 'b3', '5', 'b3'),
+        ('1', '5', '3', '1'),
+        ('1', '3', '1', '5'),
+    ),
+    # Pentatonic and scale-based patterns
+    3: (
+        ('1', 'b3', '4', '5', 'b7'),
+        ('1', '2', '3', '5', '6'),
+        ('1', '3', '5', 'b7', '5'),
+        ('1', 'b3', '5', 'b7', '1'),
+    ),
+    # More complex patterns
+    4: (
+        ('1', 'b3', '4', '5', 'b7', '5'),
+        ('1', '1', '5', '5', 'b7', 'b7', '5'),
+        ('1', '3', '5', '3', '1', '5', '1'),
+        ('1', '5', '1', '5', '4', '5', '1'),
+        ('1', 'b3', '5', 'b7', '1', 'b3', '5'),
+    ),
+}
+
+# Listening hints for each answer
+_INTERVAL_HINTS = {
+    'm2': "Think 'Jaws' theme",
+    'M2': "Think beginning of a major scale",
+    'm3': "Think 'Greensleeves'",
+    'M3': "Think 'Oh When the Saints'",
+    'P4': "Think 'Here Comes the Bride'",
+    'tritone': "Think 'The Simpsons' theme",
+    'P5': "Think 'Star Wars' theme",
+    'm6': "Think 'The Entertainer'",
+    'M6': "Think 'NBC theme'",
+    'm7': "Think 'Somewhere' from West Side Story",
+    'M7': "Think 'Take On Me'",
+    'P8': "Think 'Somewhere Over the Rainbow'",
+}
+_INTERVAL_HINT = _INTERVAL_HINTS.get
+
+_CHORD_HINTS = {
+    'major': 'Sounds happy and stable',
+    'minor': 'Sounds sad or mysterious',
+    'diminished': 'Sounds unstable and tense',
+    'augmented': 'Sounds like it\'s floating upward',
+    'major7': 'Smooth and sophisticated',
+    'minor7': 'Mellow and jazzy',
+    'dominant7': 'Has tension needing resolution',
+    'sus2': 'Open and suspended',
+    'sus4': 'Open and suspended',
+}
+_CHORD_HINT = _CHORD_HINTS.get
+
+# Scale degrees swapped into a melody to make a wrong option
+_MELODY_SWAP_DEGREES = ('2', '3', '4', '5')
+
+# Patterns used to fill up wrong melody options
+_MELODY_FALLBACK = (
+    ('1', '2', '3', '2'),
+    ('1', '3', '2', '1'),
+    ('1', '5', '3', '1'),
+    ('1', '1', '3', '3', '5', '5', '3'),
+)
+
 
 # =============================================================================
 # HELPER FUNCTIONS
@@ -66,267 +169,172 @@ def get_note_at_index(index, use_flats=False):
 
 def get_note_index(note):
     """Get the index (0-11) of a note."""
-    if note in NOTES:
-        return NOTES.index(note)
-    if note in NOTES_FLAT:
-        return NOTES_FLAT.index(note)
-    return 0
+    return _NOTE_INDEX.get(note, 0)
 
 
 def get_random_wrong_intervals(correct_interval, count=3):
     """Generate plausible wrong interval options."""
-    correct_semitones = INTERVALS.get(correct_interval, 1)
-    wrong_options = []
-    
-    # Prioritize nearby intervals (common mistakes)
-    offsets = [-2, -1, 1, 2, -3, 3, 5, 7]
-    random.shuffle(offsets)
-    
-    for offset in offsets:
-        wrong_semitones = correct_semitones + offset
-        if 1 <= wrong_semitones <= 12:
-            wrong_interval = INTERVALS_REVERSE.get(wrong_semitones)
-            if wrong_interval and wrong_interval != correct_interval and wrong_interval not in wrong_options:
-                wrong_options.append(wrong_interval)
-                if len(wrong_options) >= count:
-                    break
-    
-    return wrong_options
+    candidates = _WRONG_INTERVAL_CANDIDATES.get(correct_interval, _WRONG_INTERVAL_CANDIDATES['m2'])
+    return _sample(candidates, min(count, len(candidates)))
 
 
 def get_random_wrong_chords(correct_chord, count=3):
     """Generate plausible wrong chord options."""
-    wrong_options = []
-    all_chords = list(CHORD_FORMULAS.keys())
-    
-    # Remove correct answer
-    other_chords = [c for c in all_chords if c != correct_chord]
-    random.shuffle(other_chords)
-    
-    # Select wrong options
-    wrong_options = other_chords[:count]
+    count = min(count, len(_CHORD_NAMES) - 1)
     
-    return wrong_options
+    # Sample one extra so the correct answer can be dropped if drawn
+    picks = _sample(_CHORD_NAMES, count + 1)
+    return [c for c in picks if c != correct_chord][:count]
 
 
 def shuffle_options(correct, wrong_options):
     """Shuffle correct answer with wrong options."""
-    options = [correct] + wrong_options
-    random.shuffle(options)
-    return options
+    options = [correct, *wrong_options]
+    return _sample(options, len(options))
 
 
 # =============================================================================
 # EXERCISE GENERATORS
 # =============================================================================
 
+class EarExercise(NamedTuple):
+    """A generated ear training exercise."""
+    type: str
+    title: str
+    description: str
+    root_note: str
+    correct_answer: str
+    options: List[str]
+    hints: str
+    difficulty: int
+
+
 def generate_interval_exercise(difficulty):
     """Generate an interval identification exercise."""
     # Intervals by difficulty
-    if difficulty <= 1:
-        available_intervals = ['m2', 'M2', 'P4', 'P5', 'P8']
-    elif difficulty <= 2:
-        available_intervals = ['m2', 'M2', 'm3', 'M3', 'P4', 'P5', 'm6', 'M6', 'P8']
-    elif difficulty <= 3:
-        available_intervals = ['m2', 'M2', 'm3', 'M3', 'P4', 'tritone', 'P5', 'm6', 'M6', 'm7', 'M7', 'P8']
-    else:
-        available_intervals = list(INTERVALS.keys())
+    available_intervals = _INTERVALS_BY_DIFF[min(max(difficulty, 1), 4)]
     
     # Pick a random interval
-    correct_interval = random.choice(available_intervals)
+    correct_interval = _choice(available_intervals)
     
     # Pick a random root note
     if difficulty <= 2:
-        root_note = random.choice(NOTES[:7])  # Natural notes
+        root_note = _choice(_NATURAL_NOTES)
     else:
-        root_note = random.choice(NOTES)
+        root_note = _choice(NOTES)
     
     # Generate wrong options
     wrong_options = get_random_wrong_intervals(correct_interval, 3)
     
     # Ensure we have enough options
+    seen = set(wrong_options)
     while len(wrong_options) < 3:
-        all_intervals = list(INTERVALS.keys())
-        wrong = random.choice(all_intervals)
-        if wrong != correct_interval and wrong not in wrong_options:
+        wrong = _choice(_INTERVALS_BY_DIFF[4])
+        if wrong != correct_interval and wrong not in seen:
+            seen.add(wrong)
             wrong_options.append(wrong)
     
     options = shuffle_options(correct_interval, wrong_options[:3])
     
-    # Generate hints based on interval
-    hints_map = {
-        'm2': "Think 'Jaws' theme",
-        'M2': "Think beginning of a major scale",
-        'm3': "Think 'Greensleeves'",
-        'M3': "Think 'Oh When the Saints'",
-        'P4': "Think 'Here Comes the Bride'",
-        'tritone': "Think 'The Simpsons' theme",
-        'P5': "Think 'Star Wars' theme",
-        'm6': "Think 'The Entertainer'",
-        'M6': "Think 'NBC theme'",
-        'm7': "Think 'Somewhere' from West Side Story",
-        'M7': "Think 'Take On Me'",
-        'P8': "Think 'Somewhere Over the Rainbow'"
-    }
-    
-    return {
-        'type': 'interval',
-        'title': f'{correct_interval.upper()} Interval',
-        'description': f'Identify the interval from {root_note}.',
-        'root_note': root_note,
-        'correct_answer': correct_interval,
-        'options': json.dumps(options),
-        'hints': hints_map.get(correct_interval, 'Listen carefully to the interval quality'),
-        'difficulty': difficulty
-    }
+    return EarExercise(
+        type='interval',
+        title=f'{correct_interval.upper()} Interval',
+        description=f'Identify the interval from {root_note}.',
+        root_note=root_note,
+        correct_answer=correct_interval,
+        options=options,
+        hints=_INTERVAL_HINT(correct_interval, 'Listen carefully to the interval quality'),
+        difficulty=difficulty
+    )
 
 
 def generate_chord_exercise(difficulty):
     """Generate a chord quality identification exercise."""
     # Chord types by difficulty
-    if difficulty <= 1:
-        available_chords = ['major', 'minor']
-    elif difficulty <= 2:
-        available_chords = ['major', 'minor', 'diminished', 'augmented']
-    elif difficulty <= 3:
-        available_chords = ['major', 'minor', 'diminished', 'augmented', 'sus2', 'sus4', 'major7', 'minor7', 'dominant7']
-    else:
-        available_chords = list(CHORD_FORMULAS.keys())
+    available_chords = _CHORDS_BY_DIFF[min(max(difficulty, 1), 4)]
     
     # Pick a random chord type
-    correct_chord = random.choice(available_chords)
+    correct_chord = _choice(available_chords)
     
     # Pick a random root note
     if difficulty <= 2:
-        root_note = random.choice(NOTES[:7])  # Natural notes
+        root_note = _choice(_NATURAL_NOTES)
     else:
-        root_note = random.choice(NOTES)
+        root_note = _choice(NOTES)
     
     # Generate wrong options
     wrong_options = get_random_wrong_chords(correct_chord, 3)
     
     options = shuffle_options(correct_chord, wrong_options)
     
-    # Generate hints
-    hints_map = {
-        'major': 'Sounds happy and stable',
-        'minor': 'Sounds sad or mysterious',
-        'diminished': 'Sounds unstable and tense',
-        'augmented': 'Sounds like it\'s floating upward',
-        'major7': 'Smooth and sophisticated',
-        'minor7': 'Mellow and jazzy',
-        'dominant7': 'Has tension needing resolution',
-        'sus2': 'Open and suspended',
-        'sus4': 'Open and suspended',
-    }
-    
-    return {
-        'type': 'chord',
-        'title': f'{root_note} Chord Quality',
-        'description': f'Identify the quality of the {root_note} chord.',
-        'root_note': root_note,
-        'correct_answer': correct_chord,
-        'options': json.dumps(options),
-        'hints': hints_map.get(correct_chord, 'Listen to the chord quality'),
-        'difficulty': difficulty
-    }
+    return EarExercise(
+        type='chord',
+        title=f'{root_note} Chord Quality',
+        description=f'Identify the quality of the {root_note} chord.',
+        root_note=root_note,
+        correct_answer=correct_chord,
+        options=options,
+        hints=_CHORD_HINT(correct_chord, 'Listen to the chord quality'),
+        difficulty=difficulty
+    )
 
 
 def generate_melody_exercise(difficulty):
     """Generate a melody transcription exercise."""
     # Pick a random root note
     if difficulty <= 2:
-        root_note = random.choice(NOTES[:7])  # Natural notes
+        root_note = _choice(_NATURAL_NOTES)
     else:
-        root_note = random.choice(NOTES)
+        root_note = _choice(NOTES)
     
     # Melody patterns by difficulty
-    if difficulty <= 1:
-        # Simple 3-4 note patterns
-        patterns = [
-            ['1', '3', '5'],
-            ['1', '3', '5', '3'],
-            ['1', '5', '3', '1'],
-        ]
-    elif difficulty <= 2:
-        # Simple arpeggio-based patterns
-        patterns = [
-            ['1', '3', '5', '3'],
-            ['1', 'b3', '5', 'b3'],
-            ['1', '5', '3', '1'],
-            ['1', '3', '1', '5'],
-        ]
-    elif difficulty <= 3:
-        # Pentatonic and scale-based patterns
-        patterns = [
-            ['1', 'b3', '4', '5', 'b7'],
-            ['1', '2', '3', '5', '6'],
-            ['1', '3', '5', 'b7', '5'],
-            ['1', 'b3', '5', 'b7', '1'],
-        ]
-    else:
-        # More complex patterns
-        patterns = [
-            ['1', 'b3', '4', '5', 'b7', '5'],
-            ['1', '1', '5', '5', 'b7', 'b7', '5'],
-            ['1', '3', '5', '3', '1', '5', '1'],
-            ['1', '5', '1', '5', '4', '5', '1'],
-            ['1', 'b3', '5', 'b7', '1', 'b3', '5'],
-        ]
+    patterns = _MELODY_PATTERNS_BY_DIFF[min(max(difficulty, 1), 4)]
     
     # Pick a random pattern
-    pattern = random.choice(patterns)
+    pattern = _choice(patterns)
     correct_answer = '-'.join(pattern)
     
     # Generate wrong options by modifying the pattern
     wrong_options = []
     
     # Wrong option 1: Change one note
-    wrong1 = pattern.copy()
-    idx = random.randint(1, len(wrong1) - 1)
-    wrong1[idx] = random.choice(['2', '3', '4', '5'])
+    idx = _randint(1, len(pattern) - 1)
+    wrong1 = pattern[:idx] + (_choice(_MELODY_SWAP_DEGREES),) + pattern[idx + 1:]
     wrong_options.append('-'.join(wrong1))
     
-    # Wrong option 2: Different pattern length
+    # Wrong option 2: Different pattern length (sliced from the serialized answer)
     if len(pattern) > 3:
-        wrong2 = pattern[:-1]
-        wrong_options.append('-'.join(wrong2))
+        wrong_options.append(correct_answer[:correct_answer.rindex('-')])
     else:
-        wrong2 = pattern + ['3']
-        wrong_options.append('-'.join(wrong2))
+        wrong_options.append(correct_answer + '-3')
     
     # Wrong option 3: Scrambled pattern
-    wrong3 = pattern.copy()
-    random.shuffle(wrong3)
+    wrong3 = _sample(pattern, len(pattern))
     wrong_options.append('-'.join(wrong3))
     
-    # Ensure uniqueness
-    wrong_options = list(set([w for w in wrong_options if w != correct_answer]))[:3]
+    # Ensure uniqueness (order-preserving)
+    wrong_options = [w for w in dict.fromkeys(wrong_options) if w != correct_answer][:3]
     
     # Fill if needed
+    seen = set(wrong_options)
     while len(wrong_options) < 3:
-        all_patterns = [
-            ['1', '2', '3', '2'],
-            ['1', '3', '2', '1'],
-            ['1', '5', '3', '1'],
-            ['1', '1', '3', '3', '5', '5', '3'],
-        ]
-        wrong = '-'.join(random.choice(all_patterns))
-        if wrong != correct_answer and wrong not in wrong_options:
+        wrong = '-'.join(_choice(_MELODY_FALLBACK))
+        if wrong != correct_answer and wrong not in seen:
+            seen.add(wrong)
             wrong_options.append(wrong)
     
     options = shuffle_options(correct_answer, wrong_options[:3])
     
-    return {
-        'type': 'melody',
-        'title': 'Melody Transcription',
-        'description': f'Transcribe the melody pattern starting from {root_note}.',
-        'root_note': root_note,
-        'correct_answer': correct_answer,
-        'options': json.dumps(options),
-        'hints': 'Listen to the scale degrees and pattern',
-        'difficulty': difficulty
-    }
+    return EarExercise(
+        type='melody',
+        title='Melody Transcription',
+        description=f'Transcribe the melody pattern starting from {root_note}.',
+        root_note=root_note,
+        correct_answer=correct_answer,
+        options=options,
+        hints='Listen to the scale degrees and pattern',
+        difficulty=difficulty
+    )
 
 
 # =============================================================================
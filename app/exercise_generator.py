@@ -3,6 +3,7 @@ Dynamic exercise generator for bass guitar practice.
 This file is now a wrapper around the modular generators.
 """
 from .generators import (
+    EXERCISE_GENERATORS,
     generate_exercise,
     generate_scale_exercise,
     generate_chromatic_exercise,
@@ -18,4 +19,4 @@ from .generators.technique import (
 from .generators.theory import generate_interval_exercise
 
 # Re-exporting for backward compatibility
-EXERCISE_CATEGORIES = ['scales', 'arpeggios', 'rhythm', 'technique', 'theory']
+EXERCISE_CATEGORIES = list(EXERCISE_GENERATORS)
@@ -1,14 +1,44 @@
-import random
+from random import choice as _choice, getrandbits as _getrandbits
+from functools import lru_cache
 from ..config.settings import ARPEGGIO_FORMULAS
-from ..utils.music_theory import note_to_index as get_note_index, index_to_note as get_note_at_index
-from .utils import pick_key, pick_tempo, generate_tab, get_fret_for_note
+from ..utils.music_theory import note_to_index as get_note_index, SHARP_NAMES, FLAT_NAMES, use_flats_for
+from .utils import pick_key, pick_tempo, generate_tab, get_fret_for_note, options_by_difficulty, instruction_suffixes, clamp_difficulty
 
+# Arpeggio types by difficulty
+_ARP_TYPES_EASY = ('major triad', 'minor triad')
+_ARP_TYPES_MED = _ARP_TYPES_EASY + ('diminished triad', 'major 7th', 'minor 7th', 'dominant 7th')
+_ARP_TYPES_ALL = tuple(ARPEGGIO_FORMULAS)
+
+# Display title and subcategory slug for each arpeggio type
+_ARP_TITLE = {t: t.title() for t in ARPEGGIO_FORMULAS}
+_ARP_SUBCAT = {t: t.replace(' ', '_') for t in ARPEGGIO_FORMULAS}
+
+# Inversions by difficulty; four-note arpeggios add the 3rd inversion from difficulty 4
+_INVERSION_OPTIONS = ((0, 'root position'), (3, '1st inversion'), (3, '2nd inversion'))
+_INVERSIONS = options_by_difficulty(_INVERSION_OPTIONS)
+_INVERSIONS_4_NOTES = options_by_difficulty(_INVERSION_OPTIONS + ((4, '3rd inversion'),))
+
+# Arpeggio exercise tips (templates, only the chosen one is formatted)
+_ARP_TIPS = (
+    "A {arp_type} is built from the chord tones: {notes}.",
+    "Arpeggios outline the harmony - essential for bass players!",
+    "Visualize the chord shape as you play the arpeggio.",
+)
+
+# Extra instructions by difficulty
+_ARP_SUFFIX = instruction_suffixes((
+    (2, "Practice both ascending and descending."),
+    (3, "Connect inversions smoothly across the fretboard."),
+    (4, "Try playing over a backing track in the same key."),
+))
+
+@lru_cache(maxsize=None)
 def get_arpeggio_notes(root, arpeggio_type):
-    """Get the notes in an arpeggio."""
+    """Get the notes in an arpeggio (cached; returns a tuple)."""
     root_idx = get_note_index(root)
     formula = ARPEGGIO_FORMULAS.get(arpeggio_type, ARPEGGIO_FORMULAS['major triad'])
-    use_flats = 'b' in root or root in ['F', 'Bb', 'Eb', 'Ab', 'Db', 'Gb']
-    return [get_note_at_index(root_idx + interval, use_flats) for interval in formula]
+    names = FLAT_NAMES if use_flats_for(root) else SHARP_NAMES
+    return tuple(names[(root_idx + interval) % 12] for interval in formula)
 
 def generate_arpeggio_exercise(difficulty):
     """Generate an arpeggio practice exercise."""
@@ -16,63 +46,40 @@ def generate_arpeggio_exercise(difficulty):
     tempo = pick_tempo(difficulty)
     
     # Arpeggio types by difficulty
-    if difficulty <= 2:
-        arp_types = ['major triad', 'minor triad']
-    elif difficulty <= 3:
-        arp_types = ['major triad', 'minor triad', 'diminished triad', 'major 7th', 'minor 7th', 'dominant 7th']
-    else:
-        arp_types = list(ARPEGGIO_FORMULAS.keys())
-    
-    arp_type = random.choice(arp_types)
+    arp_types = _ARP_TYPES_EASY if difficulty <= 2 else _ARP_TYPES_MED if difficulty <= 3 else _ARP_TYPES_ALL
+    arp_type = _choice(arp_types)
     notes = get_arpeggio_notes(key, arp_type)
     
-    # Generate simple tab (root position)
+    # Generate simple tab (root position); one random bit per note picks the string
+    string_bits = _getrandbits(len(notes))
     tab_notes = []
-    for note in notes:
-        string = random.choice([3, 4])  # Prefer lower strings for bass
+    for i, note in enumerate(notes):
+        string = 4 if string_bits >> i & 1 else 3  # Prefer lower strings for bass
         fret = get_fret_for_note(string, note)
         tab_notes.append((string, fret))
     tab = generate_tab(tab_notes)
     
     # Inversions for higher difficulty
-    inversions = ['root position']
-    if difficulty >= 3:
-        inversions.extend(['1st inversion', '2nd inversion'])
-    if difficulty >= 4 and len(notes) >= 4:
-        inversions.append('3rd inversion')
-    
-    inversion = random.choice(inversions)
+    inversions = _INVERSIONS_4_NOTES if len(notes) >= 4 else _INVERSIONS
+    inversion = _choice(inversions[clamp_difficulty(difficulty)])
     
-    instructions = [
+    instructions = '\n'.join((
         f"Play the {key} {arp_type} arpeggio in {inversion}.",
         f"Start at {tempo} BPM.",
         "Play each note cleanly and let it ring into the next.",
-    ]
-    
-    if difficulty >= 2:
-        instructions.append("Practice both ascending and descending.")
-    if difficulty >= 3:
-        instructions.append("Connect inversions smoothly across the fretboard.")
-    if difficulty >= 4:
-        instructions.append("Try playing over a backing track in the same key.")
-    
-    tips = [
-        f"A {arp_type} is built from the chord tones: {', '.join(notes)}.",
-        "Arpeggios outline the harmony - essential for bass players!",
-        "Visualize the chord shape as you play the arpeggio.",
-    ]
+    )) + _ARP_SUFFIX[clamp_difficulty(difficulty)]
     
     return {
-        'title': f'{key} {arp_type.title()} Arpeggio',
+        'title': f'{key} {_ARP_TITLE[arp_type]} Arpeggio',
         'category': 'arpeggios',
-        'subcategory': arp_type.replace(' ', '_'),
+        'subcategory': _ARP_SUBCAT[arp_type],
         'difficulty': difficulty,
         'duration': 3 + difficulty,
         'key': key,
         'tempo': tempo,
-        'notes': notes,
+        'notes': list(notes),
         'tab': tab,
-        'instructions': '\n'.join(instructions),
-        'tips': random.choice(tips),
+        'instructions': instructions,
+        'tips': _choice(_ARP_TIPS).format(arp_type=arp_type, notes=', '.join(notes)),
         'description': f"Practice the {key} {arp_type} arpeggio to master chord tones.",
     }
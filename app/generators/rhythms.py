@@ -1,7 +1,74 @@
-import random
+from random import choice as _choice
 from ..config.settings import CHORD_PROGRESSIONS, RHYTHM_PATTERNS
-from ..utils.music_theory import note_to_index as get_note_index, index_to_note as get_note_at_index
-from .utils import pick_key, pick_tempo
+from ..utils.music_theory import NOTE_INDEX, SHARP_NAMES, FLAT_NAMES, use_flats_for
+from .utils import pick_key, pick_tempo, options_by_difficulty, instruction_suffixes, clamp_difficulty
+
+# Progressions by difficulty
+_PROG_NAMES_EASY = ('I-IV-V', 'I-IV', 'i-iv-v')
+_PROG_NAMES_MED = ('I-IV-V', 'I-V-vi-IV', 'I-vi-IV-V', 'I-IV', '12-bar blues')
+_PROG_NAMES_ALL = tuple(CHORD_PROGRESSIONS)
+
+def _build_prog_chords(prog_name, key):
+    """Spell out a progression's chords in a key, plus the 'Chords:' instruction line."""
+    key_idx = NOTE_INDEX[key]
+    names = FLAT_NAMES if use_flats_for(key) else SHARP_NAMES
+    chords = tuple(f"{names[(key_idx + offset) % 12]} {chord_type}"
+                   for offset, chord_type in CHORD_PROGRESSIONS[prog_name])
+    return chords, f"Chords: {' | '.join(chords[:4])}{'...' if len(chords) > 4 else ''}"
+
+# Chords and instruction line for every progression in every key:
+# _PROG_CHORDS[(prog_name, key)] -> (chords, line)
+_PROG_CHORDS = {
+    (prog_name, key): _build_prog_chords(prog_name, key)
+    for prog_name in CHORD_PROGRESSIONS
+    for key in NOTE_INDEX
+}
+
+# Bass line approaches by difficulty
+_APPROACHES = options_by_difficulty((
+    (0, 'root notes only'),
+    (2, 'root and fifth'),
+    (3, 'walking quarters'), (3, 'arpeggiated'),
+    (4, 'chromatic approaches'),
+))
+
+# Rhythm patterns by difficulty
+_RHYTHM_NAMES_EASY = ('quarter notes', 'eighth notes', 'half notes')
+_RHYTHM_NAMES_MED = ('quarter notes', 'eighth notes', 'eighth note groove', 'dotted quarter')
+_RHYTHM_NAMES_ALL = tuple(RHYTHM_PATTERNS)
+
+# Display title and subcategory slug for each rhythm pattern
+_RHYTHM_TITLE = {name: name.title() for name in RHYTHM_PATTERNS}
+_RHYTHM_SUBCAT = {name: name.replace(' ', '_') for name in RHYTHM_PATTERNS}
+
+# Extra progression instructions by difficulty
+_PROG_SUFFIX = instruction_suffixes((
+    (2, "Focus on smooth chord transitions."),
+    (3, "Add fills on the last beat of each chord."),
+    (4, "Experiment with inversions to minimize hand movement."),
+))
+
+# Extra rhythm instructions by difficulty
+_RHYTHM_SUFFIX = instruction_suffixes((
+    (2, "Accent the downbeats (1 and 3 in 4/4)."),
+    (3, "Add ghost notes between main notes."),
+    (4, "Shift the accent to create different feels."),
+    (5, "Try playing slightly behind the beat for a laid-back feel."),
+))
+
+# Chord progression tips (templates, only the chosen one is formatted)
+_PROG_TIPS = (
+    "The {prog_name} progression is common in many genres.",
+    "Listen for how each chord resolves to the next.",
+    "Root notes on beat 1 establish the harmony clearly.",
+)
+
+# Rhythm exercise tips
+_RHYTHM_TIPS = (
+    "Rhythm is the foundation of bass playing.",
+    "A steady groove is more important than complex notes.",
+    "Practice with a metronome to develop internal timing.",
+)
 
 def generate_chord_progression_exercise(difficulty):
     """Generate a chord progression practice exercise."""
@@ -9,54 +76,18 @@ def generate_chord_progression_exercise(difficulty):
     tempo = pick_tempo(difficulty)
     
     # Progressions by difficulty
-    if difficulty <= 2:
-        prog_names = ['I-IV-V', 'I-IV', 'i-iv-v']
-    elif difficulty <= 3:
-        prog_names = ['I-IV-V', 'I-V-vi-IV', 'I-vi-IV-V', 'I-IV', '12-bar blues']
-    else:
-        prog_names = list(CHORD_PROGRESSIONS.keys())
-    
-    prog_name = random.choice(prog_names)
-    progression = CHORD_PROGRESSIONS[prog_name]
-    
-    # Calculate actual chords in the key
-    key_idx = get_note_index(key)
-    use_flats = 'b' in key or key in ['F', 'Bb', 'Eb', 'Ab', 'Db', 'Gb']
-    
-    chords = []
-    for offset, chord_type in progression:
-        chord_root = get_note_at_index(key_idx + offset, use_flats)
-        chords.append(f"{chord_root} {chord_type}")
+    prog_names = _PROG_NAMES_EASY if difficulty <= 2 else _PROG_NAMES_MED if difficulty <= 3 else _PROG_NAMES_ALL
+    prog_name = _choice(prog_names)
+    chords, chords_line = _PROG_CHORDS[(prog_name, key)]
     
     # Bass line approach
-    approaches = ['root notes only']
-    if difficulty >= 2:
-        approaches.append('root and fifth')
-    if difficulty >= 3:
-        approaches.extend(['walking quarters', 'arpeggiated'])
-    if difficulty >= 4:
-        approaches.append('chromatic approaches')
+    approach = _choice(_APPROACHES[clamp_difficulty(difficulty)])
     
-    approach = random.choice(approaches)
-    
-    instructions = [
+    instructions = '\n'.join((
         f"Play the {prog_name} progression in the key of {key}.",
-        f"Chords: {' | '.join(chords[:4])}{'...' if len(chords) > 4 else ''}",
+        chords_line,
         f"Use {approach} at {tempo} BPM.",
-    ]
-    
-    if difficulty >= 2:
-        instructions.append("Focus on smooth chord transitions.")
-    if difficulty >= 3:
-        instructions.append("Add fills on the last beat of each chord.")
-    if difficulty >= 4:
-        instructions.append("Experiment with inversions to minimize hand movement.")
-    
-    tips = [
-        f"The {prog_name} progression is common in many genres.",
-        "Listen for how each chord resolves to the next.",
-        "Root notes on beat 1 establish the harmony clearly.",
-    ]
+    )) + _PROG_SUFFIX[clamp_difficulty(difficulty)]
     
     return {
         'title': f'{prog_name} Progression in {key}',
@@ -66,10 +97,10 @@ def generate_chord_progression_exercise(difficulty):
         'duration': 4 + difficulty,
         'key': key,
         'tempo': tempo,
-        'chords': chords,
+        'chords': list(chords),
         'progression_name': prog_name,
-        'instructions': '\n'.join(instructions),
-        'tips': random.choice(tips),
+        'instructions': instructions,
+        'tips': _choice(_PROG_TIPS).format(prog_name=prog_name),
         'description': f"Practice the {prog_name} chord progression to build harmonic awareness.",
     }
 
@@ -79,51 +110,30 @@ def generate_rhythm_exercise(difficulty):
     tempo = pick_tempo(difficulty)
     
     # Rhythm patterns by difficulty
-    if difficulty <= 2:
-        patterns = ['quarter notes', 'eighth notes', 'half notes']
-    elif difficulty <= 3:
-        patterns = ['quarter notes', 'eighth notes', 'eighth note groove', 'dotted quarter']
-    else:
-        patterns = list(RHYTHM_PATTERNS.keys())
-    
-    pattern_name = random.choice(patterns)
+    patterns = _RHYTHM_NAMES_EASY if difficulty <= 2 else _RHYTHM_NAMES_MED if difficulty <= 3 else _RHYTHM_NAMES_ALL
+    pattern_name = _choice(patterns)
     pattern = RHYTHM_PATTERNS[pattern_name]
     
     # Pick a simple chord or single note
     note = key  # Root note
     
-    instructions = [
+    instructions = '\n'.join((
         f"Play {pattern_name} on the note {note}.",
         f"Start at {tempo} BPM with a metronome.",
         "Focus on locking in with the click.",
-    ]
-    
-    if difficulty >= 2:
-        instructions.append("Accent the downbeats (1 and 3 in 4/4).")
-    if difficulty >= 3:
-        instructions.append("Add ghost notes between main notes.")
-    if difficulty >= 4:
-        instructions.append("Shift the accent to create different feels.")
-    if difficulty >= 5:
-        instructions.append("Try playing slightly behind the beat for a laid-back feel.")
-    
-    tips = [
-        "Rhythm is the foundation of bass playing.",
-        "A steady groove is more important than complex notes.",
-        "Practice with a metronome to develop internal timing.",
-    ]
+    )) + _RHYTHM_SUFFIX[clamp_difficulty(difficulty)]
     
     return {
-        'title': f'{pattern_name.title()} Rhythm Exercise',
+        'title': f'{_RHYTHM_TITLE[pattern_name]} Rhythm Exercise',
         'category': 'rhythm',
-        'subcategory': pattern_name.replace(' ', '_'),
+        'subcategory': _RHYTHM_SUBCAT[pattern_name],
         'difficulty': difficulty,
         'duration': 3 + difficulty,
         'key': key,
         'tempo': tempo,
         'pattern': pattern,
         'pattern_name': pattern_name,
-        'instructions': '\n'.join(instructions),
-        'tips': random.choice(tips),
+        'instructions': instructions,
+        'tips': _choice(_RHYTHM_TIPS),
         'description': f"Practice {pattern_name} to develop solid timing and groove.",
     }
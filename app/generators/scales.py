@@ -1,19 +1,92 @@
-import random
+from random import choice as _choice, randint as _randint
+from functools import lru_cache
 from ..config.settings import SCALE_FORMULAS, NOTES, BASS_STRINGS
-from ..utils.music_theory import note_to_index as get_note_index, index_to_note as get_note_at_index
-from .utils import pick_key, pick_tempo, generate_tab, get_fret_for_note
+from ..utils.music_theory import note_to_index as get_note_index, SHARP_NAMES, FLAT_NAMES, NOTE_INDEX, use_flats_for
+from .utils import pick_key, pick_tempo, generate_tab, get_fret_for_note, options_by_difficulty, instruction_suffixes, clamp_difficulty, FRET_TABLE
 
-def get_scale_notes(root, scale_type):
-    """Get the notes in a scale."""
+# Scale types by difficulty (chromatic has its own exercise)
+_SCALE_TYPES_EASY = ('major', 'natural minor', 'major pentatonic', 'minor pentatonic')
+_SCALE_TYPES_MED = _SCALE_TYPES_EASY + ('blues', 'dorian')
+_SCALE_TYPES_ALL = tuple(t for t in SCALE_FORMULAS if t != 'chromatic')
+
+# Display title and subcategory slug for each scale type
+_SCALE_TITLE = {t: t.title() for t in SCALE_FORMULAS}
+_SCALE_SUBCAT = {t: t.replace(' ', '_') for t in SCALE_FORMULAS}
+
+# Practice patterns by difficulty
+_SCALE_PATTERNS = options_by_difficulty((
+    (0, 'ascending and descending'),
+    (3, 'in thirds'), (3, 'in fourths'), (3, 'with sequences'),
+))
+
+# Extra instructions by difficulty (scales cover 2 octaves from difficulty 3)
+_SCALE_SUFFIX = instruction_suffixes((
+    (2, "Use strict alternate finger picking (index-middle)."),
+    (3, "Extend to 2 octaves across the neck."),
+    (4, "Increase tempo by 10 BPM after playing cleanly 3 times."),
+))
+_CHROMATIC_SUFFIX = instruction_suffixes((
+    (2, "Play ascending on one string, then shift to the next."),
+    (3, "Add descending pattern after reaching the top."),
+    (4, "Use eighth notes and increase tempo."),
+    (5, "Add hammer-ons for each group of 4 notes."),
+))
+
+# Scale exercise tips (templates, only the chosen one is formatted)
+_SCALE_TIPS = (
+    "Keep your fretting hand relaxed.",
+    "The {scale_type} scale formula gives it its characteristic sound.",
+    "Visualize the scale pattern on the fretboard.",
+)
+
+# Chromatic exercise tips
+_CHROMATIC_TIPS = (
+    "The chromatic scale includes all 12 notes.",
+    "Great for warming up and building finger strength.",
+    "Focus on even timing between all notes.",
+)
+
+def _build_scale_notes(root, scale_type):
+    """Spell the notes of a scale from its formula."""
     root_idx = get_note_index(root)
     formula = SCALE_FORMULAS.get(scale_type, SCALE_FORMULAS['major'])
-    use_flats = 'b' in root or root in ['F', 'Bb', 'Eb', 'Ab', 'Db', 'Gb']
-    return [get_note_at_index(root_idx + interval, use_flats) for interval in formula]
+    names = FLAT_NAMES if use_flats_for(root) else SHARP_NAMES
+    return tuple(names[(root_idx + interval) % 12] for interval in formula)
+
+# Notes of every scale for every root spelling, computed once at import
+SCALE_NOTES = {
+    (root, scale_type): _build_scale_notes(root, scale_type)
+    for root in NOTE_INDEX
+    for scale_type in SCALE_FORMULAS
+}
+
+def get_scale_notes(root, scale_type):
+    """Get the notes in a scale (precomputed; returns a tuple)."""
+    notes = SCALE_NOTES.get((root, scale_type))
+    return notes if notes is not None else _build_scale_notes(root, scale_type)
 
+def _place_note(anchor_fret, note_idx):
+    """Pick the string/fret for a pitch class near a position anchored at an E-string fret."""
+    for string_num in (4, 3, 2, 1):
+        fret = FRET_TABLE[string_num][note_idx]
+        # Adjust for octaves: lift to the lowest octave at or above anchor - 3
+        if fret < anchor_fret - 3:
+            fret += (anchor_fret - 3 - fret + 11) // 12 * 12
+        if anchor_fret - 2 <= fret <= anchor_fret + 5:
+            return string_num, fret
+    return 4, FRET_TABLE[4][note_idx]
+
+# Best (string, fret) for each pitch class around each E-string anchor fret:
+# NOTE_PLACEMENT[anchor_fret][note_idx]
+NOTE_PLACEMENT = tuple(
+    tuple(_place_note(anchor_fret, note_idx) for note_idx in range(12))
+    for anchor_fret in range(12)
+)
+
+@lru_cache(maxsize=None)
 def get_scale_positions(root, scale_type, position=1):
-    """Get fret positions for a scale in a specific position."""
+    """Get fret positions for a scale in a specific position (cached; returns a tuple)."""
     notes = get_scale_notes(root, scale_type)
-    positions = []
     
     # Determine starting fret based on root and position
     root_fret_on_e = get_fret_for_note(4, root)
@@ -23,24 +96,8 @@ def get_scale_positions(root, scale_type, position=1):
         root_fret_on_e = (root_fret_on_e + 7) % 12
     
     # Map scale notes across strings
-    for note in notes:
-        # Find the best string/fret combination near the position
-        best_string = 4
-        best_fret = get_fret_for_note(4, note)
-        
-        for string_num in [4, 3, 2, 1]:
-            fret = get_fret_for_note(string_num, note)
-            # Adjust for octaves
-            while fret < root_fret_on_e - 3:
-                fret += 12
-            if root_fret_on_e - 2 <= fret <= root_fret_on_e + 5:
-                best_string = string_num
-                best_fret = fret
-                break
-        
-        positions.append((best_string, best_fret, note))
-    
-    return positions
+    placement = NOTE_PLACEMENT[root_fret_on_e]
+    return tuple(placement[get_note_index(note)] + (note,) for note in notes)
 
 def generate_scale_exercise(difficulty):
     """Generate a scale practice exercise."""
@@ -48,15 +105,8 @@ def generate_scale_exercise(difficulty):
     tempo = pick_tempo(difficulty)
     
     # Scale types by difficulty
-    if difficulty <= 2:
-        scale_types = ['major', 'natural minor', 'major pentatonic', 'minor pentatonic']
-    elif difficulty <= 3:
-        scale_types = ['major', 'natural minor', 'major pentatonic', 'minor pentatonic', 'blues', 'dorian']
-    else:
-        scale_types = list(SCALE_FORMULAS.keys())
-        scale_types.remove('chromatic')  # Separate exercise for chromatic
-    
-    scale_type = random.choice(scale_types)
+    scale_types = _SCALE_TYPES_EASY if difficulty <= 2 else _SCALE_TYPES_MED if difficulty <= 3 else _SCALE_TYPES_ALL
+    scale_type = _choice(scale_types)
     notes = get_scale_notes(key, scale_type)
     positions = get_scale_positions(key, scale_type)
     
@@ -64,46 +114,27 @@ def generate_scale_exercise(difficulty):
     tab_notes = [(pos[0], pos[1]) for pos in positions]
     tab = generate_tab(tab_notes)
     
-    # Determine octaves
-    octaves = 1 if difficulty <= 2 else 2
-    
     # Pattern variations for higher difficulty
-    patterns = ['ascending and descending']
-    if difficulty >= 3:
-        patterns.extend(['in thirds', 'in fourths', 'with sequences'])
-    pattern = random.choice(patterns)
+    pattern = _choice(_SCALE_PATTERNS[clamp_difficulty(difficulty)])
     
-    instructions = [
+    instructions = '\n'.join((
         f"Play the {key} {scale_type} scale {pattern}.",
         f"Start at {tempo} BPM with quarter notes.",
-        f"Focus on even timing and clean note transitions.",
-    ]
-    
-    if difficulty >= 2:
-        instructions.append("Use strict alternate finger picking (index-middle).")
-    if difficulty >= 3:
-        instructions.append(f"Extend to {octaves} octaves across the neck.")
-    if difficulty >= 4:
-        instructions.append("Increase tempo by 10 BPM after playing cleanly 3 times.")
-    
-    tips = [
-        "Keep your fretting hand relaxed.",
-        f"The {scale_type} scale formula gives it its characteristic sound.",
-        "Visualize the scale pattern on the fretboard.",
-    ]
+        "Focus on even timing and clean note transitions.",
+    )) + _SCALE_SUFFIX[clamp_difficulty(difficulty)]
     
     return {
-        'title': f'{key} {scale_type.title()} Scale',
+        'title': f'{key} {_SCALE_TITLE[scale_type]} Scale',
         'category': 'scales',
-        'subcategory': scale_type.replace(' ', '_'),
+        'subcategory': _SCALE_SUBCAT[scale_type],
         'difficulty': difficulty,
         'duration': 3 + difficulty,
         'key': key,
         'tempo': tempo,
-        'notes': notes,
+        'notes': list(notes),
         'tab': tab,
-        'instructions': '\n'.join(instructions),
-        'tips': random.choice(tips),
+        'instructions': instructions,
+        'tips': _choice(_SCALE_TIPS).format(scale_type=scale_type),
         'description': f"Practice the {key} {scale_type} scale to build fretboard knowledge and finger dexterity.",
     }
 
@@ -112,29 +143,14 @@ def generate_chromatic_exercise(difficulty):
     tempo = pick_tempo(difficulty)
     
     # Starting position
-    start_fret = random.randint(1, 5)
+    start_fret = _randint(1, 5)
     
-    instructions = [
+    instructions = '\n'.join((
         f"Play the chromatic scale starting at fret {start_fret}.",
         "Use one finger per fret (1-2-3-4).",
         "Move across all four strings.",
         f"Start at {tempo} BPM with quarter notes.",
-    ]
-    
-    if difficulty >= 2:
-        instructions.append("Play ascending on one string, then shift to the next.")
-    if difficulty >= 3:
-        instructions.append("Add descending pattern after reaching the top.")
-    if difficulty >= 4:
-        instructions.append("Use eighth notes and increase tempo.")
-    if difficulty >= 5:
-        instructions.append("Add hammer-ons for each group of 4 notes.")
-    
-    tips = [
-        "The chromatic scale includes all 12 notes.",
-        "Great for warming up and building finger strength.",
-        "Focus on even timing between all notes.",
-    ]
+    )) + _CHROMATIC_SUFFIX[clamp_difficulty(difficulty)]
     
     return {
         'title': 'Chromatic Scale Exercise',
@@ -144,7 +160,7 @@ def generate_chromatic_exercise(difficulty):
         'duration': 3 + difficulty,
         'tempo': tempo,
         'start_fret': start_fret,
-        'instructions': '\n'.join(instructions),
-        'tips': random.choice(tips),
+        'instructions': instructions,
+        'tips': _choice(_CHROMATIC_TIPS),
         'description': "Practice the chromatic scale for finger coordination and fretboard coverage.",
     }
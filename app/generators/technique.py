@@ -1,6 +1,5 @@
-import random
-from .utils import pick_key, pick_tempo
-from .scales import get_scale_notes
+from random import choice as _choice
+from .utils import pick_key, pick_tempo, options_by_difficulty, instruction_suffixes, clamp_difficulty
 
 TECHNIQUES = {
     'hammer_on': 'Hammer-on',
@@ -15,80 +14,142 @@ TECHNIQUES = {
     'rake': 'Rake',
 }
 
+# Techniques by difficulty
+_TECH_LIST_EASY = ('alternating_fingers', 'muting', 'string_crossing')
+_TECH_LIST_MED = _TECH_LIST_EASY + ('hammer_on', 'pull_off', 'position_shift')
+_TECH_LIST_ALL = tuple(TECHNIQUES)
+
+# Finger patterns by difficulty, indexed 1-5
+_FINGER_PATTERNS = (
+    None,
+    ('1-2-3-4', '4-3-2-1'),
+    ('1-2-3-4', '4-3-2-1', '1-3-2-4', '4-2-3-1'),
+    ('1-2-3-4', '4-3-2-1', '1-3-2-4', '4-2-3-1', '1-4-2-3', '3-2-4-1'),
+    ('1-2-3-4', '4-3-2-1', '1-3-2-4', '4-2-3-1', '1-4-2-3', '3-2-4-1',
+     '1-4-3-2', '2-3-4-1', '1-2-4-3', '3-4-2-1'),
+    ('1-2-3-4', '4-3-2-1', '1-3-2-4', '4-2-3-1', '1-4-2-3', '3-2-4-1',
+     '1-4-3-2', '2-3-4-1', '1-2-4-3', '3-4-2-1', '2-1-4-3', '3-4-1-2'),
+)
+
+# String movements by difficulty
+_STRING_PATTERNS = options_by_difficulty((
+    (0, 'single string'),
+    (2, 'across strings ascending'),
+    (3, 'across strings descending'), (3, 'spider walk'),
+))
+
+# Extra finger exercise instructions by difficulty
+_FINGER_SUFFIX = instruction_suffixes((
+    (2, "Keep all fingers close to the fretboard."),
+    (3, "Maintain even pressure and volume on each note."),
+    (4, "Increase tempo by 5 BPM after 1 minute of clean playing."),
+))
+
+# Technique exercise tips (templates, only the chosen one is formatted)
+_TECHNIQUE_TIPS = (
+    "{technique_name} is essential for expressive bass playing.",
+    "Slow practice builds muscle memory faster than fast practice.",
+    "Record yourself to identify areas for improvement.",
+)
+
+# Finger exercise tips
+_FINGER_TIPS = (
+    "The 'spider' exercise builds finger independence.",
+    "Keep your thumb behind the neck for proper form.",
+    "Relax your hand - tension slows you down.",
+    "Focus on the weakest finger (usually the pinky).",
+)
+
+# Constant instruction steps, followed at call time by a tempo line
+def _hammer_pull_text(technique):
+    start, end = (5, 7) if technique == 'hammer_on' else (7, 5)
+    move = 'Hammer onto' if technique == 'hammer_on' else 'Pull off to'
+    description = f"Practice {TECHNIQUES[technique]}s from fret {start} to fret {end}."
+    steps = '\n'.join((
+        f"Place your finger on fret {start} of the A string.",
+        f"{move} fret {end}.",
+        "The second note should ring clearly without plucking.",
+    ))
+    return description, steps
+
+_HAMMER_PULL_TEXT = {t: _hammer_pull_text(t) for t in ('hammer_on', 'pull_off')}
+
+_SLIDE_STEPS = '\n'.join((
+    "Start on fret 5 of the A string.",
+    "Slide up to fret 7 while maintaining pressure.",
+    "Slide back down to fret 5.",
+))
+
+_STRING_CROSSING_STEPS = '\n'.join((
+    "Play fret 5 on the E string.",
+    "Cross to fret 5 on the A string.",
+    "Continue to D and G strings.",
+    "Mute each string as you leave it.",
+))
+
+_GHOST_NOTE_STEPS = '\n'.join((
+    "Play a simple groove on the root note.",
+    "Add muted 'ghost' notes with your fretting hand.",
+    "Ghost notes add percussive feel without pitch.",
+))
+
+# Per-technique builders: (technique, technique_name, key, tempo) -> (description, instructions text)
+def _hammer_pull(technique, technique_name, key, tempo):
+    description, steps = _HAMMER_PULL_TEXT[technique]
+    return description, f"{steps}\nStart slow at {tempo} BPM."
+
+def _slide(technique, technique_name, key, tempo):
+    return "Practice smooth slides between notes.", f"{_SLIDE_STEPS}\nKeep steady timing at {tempo} BPM."
+
+def _string_crossing(technique, technique_name, key, tempo):
+    return "Practice clean transitions between strings.", f"{_STRING_CROSSING_STEPS}\nUse {tempo} BPM with quarter notes."
+
+def _ghost_notes(technique, technique_name, key, tempo):
+    return "Practice adding ghost notes between main notes.", f"{_GHOST_NOTE_STEPS}\nStart at {tempo} BPM."
+
+def _position_shift(technique, technique_name, key, tempo):
+    description = f"Practice shifting positions smoothly in {key} major."
+    instructions = '\n'.join((
+        f"Play the {key} major scale starting at fret 3.",
+        "Shift to position 7 after the 5th note.",
+        "Keep the slide smooth and in time.",
+        f"Use {tempo} BPM.",
+    ))
+    return description, instructions
+
+def _default_technique(technique, technique_name, key, tempo):
+    description = f"Practice {technique_name} technique for clean, controlled playing."
+    instructions = '\n'.join((
+        f"Focus on {technique_name} technique.",
+        "Start slowly and prioritize control over speed.",
+        f"Use {tempo} BPM with eighth notes.",
+        "Gradually increase tempo as you improve.",
+    ))
+    return description, instructions
+
+_TECHNIQUE_HANDLERS = {
+    'hammer_on': _hammer_pull,
+    'pull_off': _hammer_pull,
+    'slide': _slide,
+    'string_crossing': _string_crossing,
+    'ghost_notes': _ghost_notes,
+    'position_shift': _position_shift,
+}
+
 def generate_technique_exercise(difficulty):
     """Generate a technique-focused exercise."""
     key = pick_key(difficulty)
     tempo = pick_tempo(max(1, difficulty - 1))  # Slower tempo for technique work
     
     # Techniques by difficulty
-    if difficulty <= 2:
-        tech_list = ['alternating_fingers', 'muting', 'string_crossing']
-    elif difficulty <= 3:
-        tech_list = ['alternating_fingers', 'muting', 'string_crossing', 'hammer_on', 'pull_off', 'position_shift']
-    else:
-        tech_list = list(TECHNIQUES.keys())
-    
-    technique = random.choice(tech_list)
+    tech_list = _TECH_LIST_EASY if difficulty <= 2 else _TECH_LIST_MED if difficulty <= 3 else _TECH_LIST_ALL
+    technique = _choice(tech_list)
     technique_name = TECHNIQUES[technique]
     
     # Generate exercise based on technique
-    if technique in ['hammer_on', 'pull_off']:
-        frets = [5, 7] if technique == 'hammer_on' else [7, 5]
-        description = f"Practice {technique_name}s from fret {frets[0]} to fret {frets[1]}."
-        instructions = [
-            f"Place your finger on fret {frets[0]} of the A string.",
-            f"{'Hammer onto' if technique == 'hammer_on' else 'Pull off to'} fret {frets[1]}.",
-            "The second note should ring clearly without plucking.",
-            f"Start slow at {tempo} BPM.",
-        ]
-    elif technique == 'slide':
-        description = "Practice smooth slides between notes."
-        instructions = [
-            "Start on fret 5 of the A string.",
-            "Slide up to fret 7 while maintaining pressure.",
-            "Slide back down to fret 5.",
-            f"Keep steady timing at {tempo} BPM.",
-        ]
-    elif technique == 'string_crossing':
-        description = "Practice clean transitions between strings."
-        instructions = [
-            "Play fret 5 on the E string.",
-            "Cross to fret 5 on the A string.",
-            "Continue to D and G strings.",
-            "Mute each string as you leave it.",
-            f"Use {tempo} BPM with quarter notes.",
-        ]
-    elif technique == 'ghost_notes':
-        description = "Practice adding ghost notes between main notes."
-        instructions = [
-            "Play a simple groove on the root note.",
-            "Add muted 'ghost' notes with your fretting hand.",
-            "Ghost notes add percussive feel without pitch.",
-            f"Start at {tempo} BPM.",
-        ]
-    elif technique == 'position_shift':
-        scale_notes = get_scale_notes(key, 'major')
-        description = f"Practice shifting positions smoothly in {key} major."
-        instructions = [
-            f"Play the {key} major scale starting at fret 3.",
-            "Shift to position 7 after the 5th note.",
-            "Keep the slide smooth and in time.",
-            f"Use {tempo} BPM.",
-        ]
-    else:
-        description = f"Practice {technique_name} technique for clean, controlled playing."
-        instructions = [
-            f"Focus on {technique_name} technique.",
-            "Start slowly and prioritize control over speed.",
-            f"Use {tempo} BPM with eighth notes.",
-            "Gradually increase tempo as you improve.",
-        ]
-    
-    tips = [
-        f"{technique_name} is essential for expressive bass playing.",
-        "Slow practice builds muscle memory faster than fast practice.",
-        "Record yourself to identify areas for improvement.",
-    ]
+    description, instructions = _TECHNIQUE_HANDLERS.get(technique, _default_technique)(
+        technique, technique_name, key, tempo
+    )
     
     return {
         'title': f'{technique_name} Exercise',
@@ -100,8 +161,8 @@ def generate_technique_exercise(difficulty):
         'tempo': tempo,
         'technique': technique,
         'technique_name': technique_name,
-        'instructions': '\n'.join(instructions),
-        'tips': random.choice(tips),
+        'instructions': instructions,
+        'tips': _choice(_TECHNIQUE_TIPS).format(technique_name=technique_name),
         'description': description,
     }
 
@@ -110,48 +171,17 @@ def generate_finger_exercise(difficulty):
     tempo = pick_tempo(max(1, difficulty - 1))
     
     # Finger patterns
-    patterns = {
-        1: ['1-2-3-4', '4-3-2-1'],
-        2: ['1-2-3-4', '4-3-2-1', '1-3-2-4', '4-2-3-1'],
-        3: ['1-2-3-4', '4-3-2-1', '1-3-2-4', '4-2-3-1', '1-4-2-3', '3-2-4-1'],
-        4: ['1-2-3-4', '4-3-2-1', '1-3-2-4', '4-2-3-1', '1-4-2-3', '3-2-4-1', 
-            '1-4-3-2', '2-3-4-1', '1-2-4-3', '3-4-2-1'],
-        5: ['1-2-3-4', '4-3-2-1', '1-3-2-4', '4-2-3-1', '1-4-2-3', '3-2-4-1',
-            '1-4-3-2', '2-3-4-1', '1-2-4-3', '3-4-2-1', '2-1-4-3', '3-4-1-2'],
-    }
-    
-    pattern_list = patterns.get(difficulty, patterns[1])
-    pattern = random.choice(pattern_list)
+    pattern = _choice(_FINGER_PATTERNS[clamp_difficulty(difficulty, 1)])
     
     # String movement
-    string_patterns = ['single string']
-    if difficulty >= 2:
-        string_patterns.append('across strings ascending')
-    if difficulty >= 3:
-        string_patterns.extend(['across strings descending', 'spider walk'])
+    string_pattern = _choice(_STRING_PATTERNS[clamp_difficulty(difficulty)])
     
-    string_pattern = random.choice(string_patterns)
-    
-    instructions = [
+    instructions = '\n'.join((
         f"Play the finger pattern: {pattern}",
-        f"Use one finger per fret, starting at fret 5.",
+        "Use one finger per fret, starting at fret 5.",
         f"Movement: {string_pattern}",
         f"Start at {tempo} BPM with eighth notes.",
-    ]
-    
-    if difficulty >= 2:
-        instructions.append("Keep all fingers close to the fretboard.")
-    if difficulty >= 3:
-        instructions.append("Maintain even pressure and volume on each note.")
-    if difficulty >= 4:
-        instructions.append("Increase tempo by 5 BPM after 1 minute of clean playing.")
-    
-    tips = [
-        "The 'spider' exercise builds finger independence.",
-        "Keep your thumb behind the neck for proper form.",
-        "Relax your hand - tension slows you down.",
-        "Focus on the weakest finger (usually the pinky).",
-    ]
+    )) + _FINGER_SUFFIX[clamp_difficulty(difficulty)]
     
     return {
         'title': f'Finger Pattern: {pattern}',
@@ -162,7 +192,7 @@ def generate_finger_exercise(difficulty):
         'tempo': tempo,
         'pattern': pattern,
         'string_pattern': string_pattern,
-        'instructions': '\n'.join(instructions),
-        'tips': random.choice(tips),
+        'instructions': instructions,
+        'tips': _choice(_FINGER_TIPS),
         'description': f"Build finger independence and strength with the {pattern} pattern.",
     }
@@ -1,46 +1,77 @@
-import random
+from random import choice as _choice
+from functools import lru_cache
 from ..config.settings import NOTES, TEMPO_RANGES, BASS_STRINGS
 from ..utils.music_theory import note_to_index as get_note_index
 
-# Keys by difficulty (natural keys first, then sharps/flats)
-KEYS_BY_DIFFICULTY = {
-    1: ['C', 'G', 'A', 'E', 'D'],
-    2: ['C', 'G', 'A', 'E', 'D', 'F', 'B'],
-    3: NOTES[:7],  # Natural notes
-    4: NOTES[:10],
-    5: NOTES,
+# Keys by difficulty (natural keys first, then sharps/flats), indexed 1-5
+_KEYS_BY_DIFF = (
+    None,
+    ('C', 'G', 'A', 'E', 'D'),
+    ('C', 'G', 'A', 'E', 'D', 'F', 'B'),
+    tuple(NOTES[:7]),  # Natural notes
+    tuple(NOTES[:10]),
+    tuple(NOTES),
+)
+
+# Tempos (multiples of 5 within TEMPO_RANGES) indexed 1-5;
+# slots 0 and 6 hold the 60-100 BPM fallback for difficulties outside the table
+_DEFAULT_TEMPOS = tuple(range(60, 101, 5))
+_TEMPO_CHOICES = (
+    _DEFAULT_TEMPOS,
+    *(tuple(range(-(-TEMPO_RANGES[d][0] // 5) * 5, TEMPO_RANGES[d][1] + 1, 5)) for d in range(1, 6)),
+    _DEFAULT_TEMPOS,
+)
+
+# Empty tab cell
+BLANK_CELL = '---'
+
+# Fret (0-11) of every note index on each string: FRET_TABLE[string_num][note_idx]
+FRET_TABLE = {
+    string_num: tuple((note_idx - open_idx) % 12 for note_idx in range(12))
+    for string_num, open_idx in BASS_STRINGS.items()
 }
 
+def options_by_difficulty(gated_options, max_difficulty=5):
+    """Precompute the (min_difficulty, option) options unlocked at each difficulty (0..max)."""
+    return tuple(
+        tuple(option for min_difficulty, option in gated_options if difficulty >= min_difficulty)
+        for difficulty in range(max_difficulty + 1)
+    )
+
+def instruction_suffixes(gated_lines, max_difficulty=5):
+    """Precompute the extra instruction lines unlocked at each difficulty (0..max)."""
+    return tuple(
+        ''.join(f'\n{line}' for line in lines)
+        for lines in options_by_difficulty(gated_lines, max_difficulty)
+    )
+
+def clamp_difficulty(difficulty, low=0, high=5):
+    """Clamp a difficulty to an index into a per-difficulty table (low..high)."""
+    return min(max(difficulty, low), high)
+
 def pick_key(difficulty):
     """Pick a random key appropriate for the difficulty level."""
-    keys = KEYS_BY_DIFFICULTY.get(difficulty, NOTES)
-    return random.choice(keys)
+    return _choice(_KEYS_BY_DIFF[clamp_difficulty(difficulty, 1)])
 
 def pick_tempo(difficulty):
-    """Pick a random tempo appropriate for the difficulty level."""
-    min_tempo, max_tempo = TEMPO_RANGES.get(difficulty, (60, 100))
-    # Round to nearest 5
-    return round(random.randint(min_tempo, max_tempo) / 5) * 5
+    """Pick a random tempo (a multiple of 5) appropriate for the difficulty level."""
+    return _choice(_TEMPO_CHOICES[clamp_difficulty(difficulty, 0, 6)])
 
+@lru_cache(maxsize=None)
 def get_fret_for_note(string_num, note):
-    """Get the fret number for a note on a specific string (within first 12 frets)."""
-    open_note_idx = BASS_STRINGS[string_num]
-    target_idx = get_note_index(note)
-    fret = (target_idx - open_note_idx) % 12
-    return fret
+    """Get the fret number for a note on a specific string (within first 12 frets, cached)."""
+    return FRET_TABLE[string_num][get_note_index(note)]
+
+def _tab_column(string_num, fret):
+    """Get the cells for one note across the G, D, A and E lines."""
+    cell = f'{fret:2d}-'
+    return tuple(cell if string_num == s else BLANK_CELL for s in (1, 2, 3, 4))
+
+# Pre-built tab columns for every string and frets 0-24
+TAB_COLUMNS = {(s, f): _tab_column(s, f) for s in (1, 2, 3, 4) for f in range(25)}
 
 def generate_tab(notes_per_string):
     """Generate tab notation for a sequence of notes."""
-    lines = {1: 'G|', 2: 'D|', 3: 'A|', 4: 'E|'}
-    
-    for string_num, fret in notes_per_string:
-        for s in [1, 2, 3, 4]:
-            if s == string_num:
-                lines[s] += f'{fret:2d}-'
-            else:
-                lines[s] += '---'
-    
-    for s in [1, 2, 3, 4]:
-        lines[s] += '|'
-    
-    return '\n'.join([lines[1], lines[2], lines[3], lines[4]])
+    columns = [TAB_COLUMNS.get((s, f)) or _tab_column(s, f) for s, f in notes_per_string]
+    lines = zip(*columns) if columns else ((), (), (), ())
+    return '\n'.join(f"{name}|{''.join(line)}|" for name, line in zip('GDAE', lines))
@@ -18,7 +18,7 @@ class Exercise(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     
     # Relationships
-    session_exercises = db.relationship('SessionExercise', backref='exercise', lazy=True)
+    session_exercises = db.relationship('SessionExercise', back_populates='exercise', lazy=True)
     
     def __repr__(self):
         return f'<Exercise {self.title}>'
@@ -81,7 +81,7 @@ class EarTrainingExercise(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     
     # Relationships
-    results = db.relationship('EarTrainingResult', backref='exercise', lazy=True)
+    results = db.relationship('EarTrainingResult', back_populates='exercise', lazy=True)
     
     def __repr__(self):
         return f'<EarTrainingExercise {self.title}>'
@@ -111,7 +111,7 @@ class DynamicExercise(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     
     # Relationships
-    session_exercises = db.relationship('SessionExercise', backref='dynamic_exercise', lazy=True)
+    session_exercises = db.relationship('SessionExercise', back_populates='dynamic_exercise', lazy=True)
     
     def __repr__(self):
         return f'<DynamicExercise {self.title}>'
@@ -6,7 +6,7 @@ class PracticeSession(db.Model):
     __tablename__ = 'practice_sessions'
     
     id = db.Column(db.Integer, primary_key=True)
-    session_date = db.Column(db.Date, nullable=False, default=date.today)
+    session_date = db.Column(db.Date, nullable=False, default=date.today, index=True)
     planned_duration = db.Column(db.Integer)  # minutes
     actual_duration = db.Column(db.Integer)  # minutes
     completed_exercises = db.Column(db.Integer, default=0)
@@ -24,9 +24,8 @@ class PracticeSession(db.Model):
     
     def calculate_accuracy(self):
         """Calculate the percentage of completed exercises in this session."""
-        if self.total_exercises == 0:
-            return 0.0
-        return (self.completed_exercises / self.total_exercises) * 100.0
+        # An empty session has no completed exercises either, so it comes out as 0.0
+        return self.completed_exercises * 100.0 / (self.total_exercises or 1)
     
     def get_duration(self):
         """Get the duration of the session in minutes."""
@@ -35,11 +34,15 @@ class PracticeSession(db.Model):
 class SessionExercise(db.Model):
     """Junction table for exercises within a practice session."""
     __tablename__ = 'session_exercises'
+    __table_args__ = (
+        # Session pages list exercises by session in order and look them up by position
+        db.Index('ix_session_exercises_session_order', 'session_id', 'order_index'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     session_id = db.Column(db.Integer, db.ForeignKey('practice_sessions.id'), nullable=False)
-    exercise_id = db.Column(db.Integer, db.ForeignKey('exercises.id'), nullable=True)  # For static exercises
-    dynamic_exercise_id = db.Column(db.Integer, db.ForeignKey('dynamic_exercises.id'), nullable=True)  # For dynamic
+    exercise_id = db.Column(db.Integer, db.ForeignKey('exercises.id'), nullable=True, index=True)  # For static exercises
+    dynamic_exercise_id = db.Column(db.Integer, db.ForeignKey('dynamic_exercises.id'), nullable=True, index=True)  # For dynamic
     order_index = db.Column(db.Integer, default=0)
     phase = db.Column(db.String(20))  # warmup, technique, musical, cooldown
     completed = db.Column(db.Boolean, default=False)
@@ -48,9 +51,19 @@ class SessionExercise(db.Model):
     difficulty_felt = db.Column(db.Integer)  # 1-10
     exercise_notes = db.Column(db.Text)
     
+    # Relationships (joined: the session page reads one of these for every row)
+    exercise = db.relationship('Exercise', back_populates='session_exercises', lazy='joined')
+    dynamic_exercise = db.relationship('DynamicExercise', back_populates='session_exercises', lazy='joined')
+    
     def __repr__(self):
         return f'<SessionExercise in session {self.session_id}>'
     
+    @classmethod
+    def bulk_create(cls, rows):
+        """Insert many session exercises (dicts of column values) in one batched INSERT."""
+        if rows:
+            db.session.execute(db.insert(cls), rows)
+    
     @property
     def exercise_title(self):
         """Get the exercise title from either static or dynamic exercise."""
@@ -72,7 +85,7 @@ class Progress(db.Model):
     __tablename__ = 'progress'
     
     id = db.Column(db.Integer, primary_key=True)
-    category = db.Column(db.String(30), nullable=False)  # scales, arpeggios, etc.
+    category = db.Column(db.String(30), nullable=False, unique=True)  # scales, arpeggios, etc.
     skill_level = db.Column(db.Float, default=0.0)  # 0.0-1.0 progress within level
     exercises_completed = db.Column(db.Integer, default=0)
     total_practice_time = db.Column(db.Integer, default=0)  # minutes
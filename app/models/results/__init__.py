@@ -0,0 +1,44 @@
+from datetime import datetime
+from ..base import db
+
+class EarTrainingResult(db.Model):
+    """Results from ear training exercises."""
+    __tablename__ = 'ear_training_results'
+    __table_args__ = (
+        # Stats and recent results are filtered by exercise and ordered by time
+        db.Index('ix_ear_training_results_exercise_time', 'exercise_id', 'practiced_at'),
+    )
+    
+    id = db.Column(db.Integer, primary_key=True)
+    exercise_id = db.Column(db.Integer, db.ForeignKey('ear_training_exercises.id'), nullable=False)
+    user_answer = db.Column(db.Text)
+    correct = db.Column(db.Boolean)
+    response_time_ms = db.Column(db.Integer)
+    practiced_at = db.Column(db.DateTime, default=datetime.utcnow)
+    
+    # Relationships (joined: recent results lists show the exercise title per row)
+    exercise = db.relationship('EarTrainingExercise', back_populates='results', lazy='joined')
+    
+    def __repr__(self):
+        return f'<EarTrainingResult exercise={self.exercise_id} correct={self.correct}>'
+
+class QuizResult(db.Model):
+    """Results from dynamically generated quiz attempts."""
+    __tablename__ = 'quiz_results'
+    __table_args__ = (
+        # Adaptive difficulty reads the latest results per quiz type
+        db.Index('ix_quiz_results_type_time', 'quiz_type', 'attempted_at'),
+    )
+    
+    id = db.Column(db.Integer, primary_key=True)
+    quiz_id = db.Column(db.Integer, default=0)  # Not used for dynamic quizzes
+    quiz_type = db.Column(db.String(50), nullable=False)  # Category: fretboard, theory, chords, scales, rhythm, technique
+    user_answer = db.Column(db.String(100))
+    correct = db.Column(db.Boolean)
+    response_time_ms = db.Column(db.Integer)
+    attempted_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
+    
+    def __repr__(self):
+        return f'<QuizResult type={self.quiz_type} correct={self.correct}>'
+
+__all__ = ['EarTrainingResult', 'QuizResult']
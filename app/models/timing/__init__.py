@@ -19,7 +19,7 @@ class TimingSession(db.Model):
     average_timing_ms = db.Column(db.Float, default=0.0)  # Average deviation from perfect
     score = db.Column(db.Integer, default=0)
     duration_seconds = db.Column(db.Integer, default=0)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
     
     def __repr__(self):
         return f'<TimingSession {self.game_mode} @ {self.tempo_bpm}bpm score={self.score}>'
@@ -41,6 +41,11 @@ class TimingSession(db.Model):
 class TimingHighScore(db.Model):
     """High scores for timing practice games."""
     __tablename__ = 'timing_high_scores'
+    __table_args__ = (
+        # Score lookup per game settings, and best score per game mode
+        db.Index('ix_timing_high_scores_mode_tempo_diff', 'game_mode', 'tempo_bpm', 'difficulty'),
+        db.Index('ix_timing_high_scores_mode_score', 'game_mode', 'high_score'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     game_mode = db.Column(db.String(30), nullable=False)
@@ -1,6 +1,10 @@
 from datetime import datetime
 from ..base import db
 
+# Recommended exercise difficulty (1-5) for each skill level 0-10:
+# 1-2 -> 1, 3-4 -> 2, 5-6 -> 3, 7-8 -> 4, 9-10 -> 5
+_RECOMMENDED_DIFFICULTY = (1, 1, 1, 2, 2, 3, 3, 4, 4, 5, 5)
+
 class UserProfile(db.Model):
     """User profile settings for the local user."""
     __tablename__ = 'user_profile'
@@ -18,8 +22,7 @@ class UserProfile(db.Model):
     
     def get_recommended_difficulty(self, category=None):
         """Map absolute skill level (1-10) to recommended exercise difficulty (1-5)."""
-        # Simple mapping: 1-2 -> 1, 3-4 -> 2, 5-6 -> 3, 7-8 -> 4, 9-10 -> 5
-        return max(1, min(5, (self.skill_level + 1) // 2))
+        return _RECOMMENDED_DIFFICULTY[max(0, min(10, self.skill_level))]
     
     def update_preferences(self, **kwargs):
         """Update user preferences from keyword arguments."""
@@ -1,10 +1,11 @@
 """
 Practice session generation logic using dynamic exercise generation.
 """
+import json
 import random
 from datetime import date
 from .models import db, PracticeSession, SessionExercise, Progress, DynamicExercise
-from .exercise_generator import generate_exercise, EXERCISE_CATEGORIES
+from .exercise_generator import EXERCISE_GENERATORS, EXERCISE_CATEGORIES
 
 
 def calculate_session_structure(duration):
@@ -22,52 +23,56 @@ def calculate_session_structure(duration):
 
 def get_weak_categories():
     """Identify categories that need more practice based on progress data."""
-    progress_data = Progress.query.all()
+    # Bottom 3 categories by skill level, selected by the database (ties keep row order)
+    weak = db.session.scalars(
+        db.select(Progress.category).order_by(Progress.skill_level, Progress.id).limit(3)
+    ).all()
     
-    if not progress_data:
+    if not weak:
         return ['scales', 'technique', 'rhythm']
     
-    # Sort by skill level (lowest first)
-    sorted_progress = sorted(progress_data, key=lambda p: p.skill_level)
-    
-    # Return bottom 3 categories
-    weak = [p.category for p in sorted_progress][:3]
-    
     # Ensure we have at least some categories
     for cat in EXERCISE_CATEGORIES:
         if cat not in weak and len(weak) < 3:
             weak.append(cat)
     
-    return weak if weak else ['scales', 'technique', 'rhythm']
+    return weak
 
 
-def generate_practice_session(skill_level, duration_minutes, preferred_genre=None):
+def _dynamic_exercise_row(exercise_data, duration):
+    """Map generated exercise data to DynamicExercise column values."""
+    return {
+        'title': exercise_data['title'],
+        'category': exercise_data['category'],
+        'subcategory': exercise_data.get('subcategory', ''),
+        'difficulty_level': exercise_data['difficulty'],
+        'estimated_duration': duration,
+        'instructions': exercise_data.get('instructions', ''),
+        'tips': exercise_data.get('tips', ''),
+        'description': exercise_data.get('description', ''),
+        'key_signature': exercise_data.get('key', ''),
+        'tempo_bpm': exercise_data.get('tempo', 80),
+        'tab_notation': exercise_data.get('tab', ''),
+        'notes_data': json.dumps(exercise_data.get('notes', [])),
+    }
+
+
+def _plan_phases(structure, skill_level, weak_categories):
     """
-    Generate a balanced practice session with dynamically generated exercises.
+    Plan a session without touching the database.
+    Returns (phase, exercise_data, duration) tuples in session order.
     """
-    # Get session structure
-    structure = calculate_session_structure(duration_minutes)
+    plan = []
     
-    # Create the practice session
-    session = PracticeSession(
-        session_date=date.today(),
-        planned_duration=duration_minutes,
-        total_exercises=0
-    )
-    db.session.add(session)
-    db.session.flush()  # Get session ID
-    
-    order_index = 0
-    
-    # Get weak categories for focus
-    weak_categories = get_weak_categories()
+    # Warm-up and cool-down run one level easier
+    easy_level = max(1, skill_level - 1)
     
     # Phase definitions with category preferences
     phases = [
-        ('warmup', structure['warmup'], ['scales', 'technique'], max(1, skill_level - 1)),
+        ('warmup', structure['warmup'], ['scales', 'technique'], easy_level),
         ('technique', structure['technique'], weak_categories + ['technique'], skill_level),
         ('musical', structure['musical'], ['rhythm', 'arpeggios', 'theory'], skill_level),
-        ('cooldown', structure['cooldown'], ['scales', 'arpeggios'], max(1, skill_level - 1)),
+        ('cooldown', structure['cooldown'], ['scales', 'arpeggios'], easy_level),
     ]
     
     for phase_name, phase_duration, categories, difficulty in phases:
@@ -76,51 +81,78 @@ def generate_practice_session(skill_level, duration_minutes, preferred_genre=Non
         
         remaining_time = phase_duration
         
-        while remaining_time >= 3:  # Minimum 3 minutes per exercise
-            # Pick a random category from phase preferences
-            category = random.choice(categories)
+        # Resolve the phase's category preferences to generator pools once
+        pools = [EXERCISE_GENERATORS[c] for c in categories if c in EXERCISE_GENERATORS]
+        if not pools:
+            pools = list(EXERCISE_GENERATORS.values())
+        
+        # Each exercise fills at least 3 minutes, so phase_duration // 3 category
+        # picks always suffice; draw them in one batch and stop once the phase is full
+        for generators in random.choices(pools, k=phase_duration // 3):
+            if remaining_time < 3:  # Minimum 3 minutes per exercise
+                break
             
-            # Generate a dynamic exercise
-            exercise_data = generate_exercise(category, difficulty)
+            # Generate a dynamic exercise from one of the category's generators
+            exercise_data = random.choice(generators)(difficulty)
+            exercise_data.setdefault('difficulty', difficulty)  # Stored with the plan
             
             exercise_time = exercise_data.get('duration', 5)
             if exercise_time > remaining_time:
                 exercise_time = remaining_time
             
-            # Create a DynamicExercise record
-            dynamic_exercise = DynamicExercise(
-                title=exercise_data['title'],
-                category=exercise_data['category'],
-                subcategory=exercise_data.get('subcategory', ''),
-                difficulty_level=exercise_data.get('difficulty', difficulty),
-                estimated_duration=exercise_time,
-                instructions=exercise_data.get('instructions', ''),
-                tips=exercise_data.get('tips', ''),
-                description=exercise_data.get('description', ''),
-                key_signature=exercise_data.get('key', ''),
-                tempo_bpm=exercise_data.get('tempo', 80),
-                tab_notation=exercise_data.get('tab', ''),
-                notes_data=str(exercise_data.get('notes', [])),
-            )
-            db.session.add(dynamic_exercise)
-            db.session.flush()
-            
-            # Create session exercise link
-            session_exercise = SessionExercise(
-                session_id=session.id,
-                exercise_id=0,  # Not using static exercises
-                dynamic_exercise_id=dynamic_exercise.id,
-                order_index=order_index,
-                planned_duration=exercise_time,
-                phase=phase_name
-            )
-            db.session.add(session_exercise)
-            
-            order_index += 1
+            plan.append((phase_name, exercise_data, exercise_time))
             remaining_time -= exercise_time
     
-    # Update total exercises count
-    session.total_exercises = order_index
+    return plan
+
+
+def _persist_plan(session, plan):
+    """Write a planned session's exercises and links with two batched INSERTs."""
+    if not plan:
+        return
+    
+    dynamic_rows = []  # DynamicExercise column values, in session order
+    link_rows = []  # The matching SessionExercise values, minus the exercise ids
+    for order_index, (phase_name, exercise_data, duration) in enumerate(plan):
+        dynamic_rows.append(_dynamic_exercise_row(exercise_data, duration))
+        link_rows.append({
+            'session_id': session.id,
+            'exercise_id': 0,  # Not using static exercises
+            'order_index': order_index,
+            'planned_duration': duration,
+            'phase': phase_name,
+        })
+    
+    # Assign the exercise ids up front (SQLite runs an ordered INSERT ... RETURNING
+    # row by row); the session flush holds the write lock, so ids past the max are free
+    table = DynamicExercise.__table__
+    first_id = (db.session.scalar(db.select(db.func.max(table.c.id))) or 0) + 1
+    for dynamic_id, (dynamic_row, link_row) in enumerate(zip(dynamic_rows, link_rows), first_id):
+        dynamic_row['id'] = link_row['dynamic_exercise_id'] = dynamic_id
+    db.session.execute(table.insert(), dynamic_rows)
+    SessionExercise.bulk_create(link_rows)
+
+
+def generate_practice_session(skill_level, duration_minutes, preferred_genre=None):
+    """
+    Generate a balanced practice session with dynamically generated exercises.
+    """
+    # Get session structure
+    structure = calculate_session_structure(duration_minutes)
+    
+    # Plan every exercise first, so the database write lock is not held
+    # while exercises are being generated
+    plan = _plan_phases(structure, skill_level, get_weak_categories())
+    
+    session = PracticeSession(
+        session_date=date.today(),
+        planned_duration=duration_minutes,
+        total_exercises=len(plan)
+    )
+    db.session.add(session)
+    db.session.flush()  # Get session ID
+    
+    _persist_plan(session, plan)
     
     db.session.commit()
     
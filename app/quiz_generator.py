@@ -2,16 +2,19 @@
 Dynamic quiz generator for bass guitar practice.
 Generates questions algorithmically based on music theory.
 """
-import random
-import json
+from functools import lru_cache
+from random import choice as _choice, randint as _randint, sample as _sample, shuffle as _shuffle
 from .config.settings import (
     NOTES, NOTES_FLAT, BASS_STRINGS, STRING_NAMES,
     SCALE_FORMULAS, KEY_SIGNATURES, CIRCLE_OF_FIFTHS
 )
 from .utils.music_theory import (
+    NOTE_INDEX, SHARP_NAMES, FLAT_NAMES,
     note_to_index as get_note_index,
-    index_to_note as get_note_at_index
+    index_to_note as get_note_at_index,
+    use_flats_for
 )
+from .generators.scales import get_scale_notes
 
 # Intervals (semitones -> name)
 INTERVALS = {
@@ -50,58 +53,93 @@ CHORD_FORMULAS = {
     'dominant 9th': [0, 4, 7, 10, 14],
 }
 
+# Choice pools drawn from on every question, built once at import
+CHORD_TYPES_ALL = tuple(CHORD_FORMULAS)
+SCALE_TYPES_ALL = tuple(SCALE_FORMULAS)
+KEY_SIGNATURE_KEYS = tuple(KEY_SIGNATURES)
+INTERVAL_KEYS_EASY = tuple(k for k in INTERVALS if k <= 7)  # Up to a Perfect 5th
+INTERVAL_KEYS_ALL = tuple(INTERVALS)
+
 
 # =============================================================================
 # HELPER FUNCTIONS
 # =============================================================================
 
 
-def get_chord_notes(root, chord_type):
-    """Get the notes in a chord."""
+def _build_chord_notes(root, chord_type):
+    """Spell the notes of a chord from its formula."""
     root_idx = get_note_index(root)
-    formula = CHORD_FORMULAS.get(chord_type, [0, 4, 7])
-    use_flats = 'b' in root or root in ['F', 'Bb', 'Eb', 'Ab', 'Db', 'Gb']
-    return [get_note_at_index(root_idx + interval, use_flats) for interval in formula]
+    formula = CHORD_FORMULAS.get(chord_type, CHORD_FORMULAS['major'])
+    names = FLAT_NAMES if use_flats_for(root) else SHARP_NAMES
+    return tuple(names[(root_idx + interval) % 12] for interval in formula)
 
 
-def get_scale_notes(root, scale_type):
-    """Get the notes in a scale."""
-    root_idx = get_note_index(root)
-    formula = SCALE_FORMULAS.get(scale_type, [0, 2, 4, 5, 7, 9, 11])
-    use_flats = 'b' in root or root in ['F', 'Bb', 'Eb', 'Ab', 'Db', 'Gb']
-    return [get_note_at_index(root_idx + interval, use_flats) for interval in formula]
+# Notes of every chord for every root spelling, computed once at import
+CHORD_NOTES = {
+    (root, chord_type): _build_chord_notes(root, chord_type)
+    for root in NOTE_INDEX
+    for chord_type in CHORD_FORMULAS
+}
+
 
+# Chord notes as the space-separated answer strings the chord tones quiz shows
+CHORD_NOTES_STR = {key: ' '.join(notes) for key, notes in CHORD_NOTES.items()}
+
+# Scale degree names for chord formula intervals (semitones -> degree)
+INTERVAL_DEGREES = {
+    0: '1', 2: '2', 3: 'b3', 4: '3', 5: '4', 6: 'b5', 7: '5',
+    8: '#5', 9: '6', 10: 'b7', 11: '7', 14: '9'
+}
+
+# Chord formulas in degree notation, e.g. 'major' -> '1-3-5'
+CHORD_FORMULA_STR = {
+    chord_type: '-'.join(INTERVAL_DEGREES.get(i, str(i)) for i in formula)
+    for chord_type, formula in CHORD_FORMULAS.items()
+}
 
+
+def get_chord_notes(root, chord_type):
+    """Get the notes in a chord (precomputed; returns a tuple)."""
+    notes = CHORD_NOTES.get((root, chord_type))
+    return notes if notes is not None else _build_chord_notes(root, chord_type)
+
+
+@lru_cache(maxsize=None)
 def get_note_on_fretboard(string_num, fret):
-    """Get the note at a specific fretboard position."""
+    """Get the note at a specific fretboard position (cached)."""
     open_note_idx = BASS_STRINGS[string_num]
     return get_note_at_index(open_note_idx + fret)
 
 
+# Semitone offsets for plausible wrong notes (nearby notes are common mistakes).
+# They are distinct and nonzero mod 12, so each one names a different wrong pitch.
+_WRONG_NOTE_OFFSETS = (-2, -1, 1, 2, -3, 3, 5, 7)
+
+
 def get_random_wrong_notes(correct_note, count=3):
     """Generate plausible wrong note options."""
     correct_idx = get_note_index(correct_note)
-    wrong_notes = []
-    
-    # Prioritize nearby notes (common mistakes)
-    offsets = [-2, -1, 1, 2, -3, 3, 5, 7]
-    random.shuffle(offsets)
-    
-    for offset in offsets:
-        wrong = get_note_at_index(correct_idx + offset)
-        if wrong != correct_note and wrong not in wrong_notes:
-            wrong_notes.append(wrong)
-            if len(wrong_notes) >= count:
+    offsets = _sample(_WRONG_NOTE_OFFSETS, min(count, len(_WRONG_NOTE_OFFSETS)))
+    return [get_note_at_index(correct_idx + offset) for offset in offsets]
+
+
+def unique_wrong_options(candidates, correct, count=3):
+    """Take the first `count` distinct candidates that differ from the correct answer, in order."""
+    wrong_options = []
+    seen = {correct}
+    for wrong in candidates:
+        if wrong not in seen:
+            seen.add(wrong)
+            wrong_options.append(wrong)
+            if len(wrong_options) == count:
                 break
-    
-    return wrong_notes
+    return wrong_options
 
 
 def shuffle_options(correct, wrong_options):
     """Shuffle correct answer with wrong options."""
-    options = [correct] + wrong_options
-    random.shuffle(options)
-    return options
+    options = [correct, *wrong_options]
+    return _sample(options, len(options))
 
 
 # =============================================================================
@@ -113,8 +151,8 @@ def generate_fretboard_quiz(difficulty):
     # Higher difficulty = more frets, sharps/flats
     max_fret = min(5 + difficulty * 2, 12)
     
-    string_num = random.randint(1, 4)
-    fret = random.randint(0, max_fret)
+    string_num = _randint(1, 4)
+    fret = _randint(0, max_fret)
     
     correct_note = get_note_on_fretboard(string_num, fret)
     wrong_notes = get_random_wrong_notes(correct_note)
@@ -124,7 +162,7 @@ def generate_fretboard_quiz(difficulty):
         'title': 'Identify the Note',
         'question': f'What note is at fret {fret} on the {STRING_NAMES[string_num]} string?',
         'correct_answer': correct_note,
-        'options': json.dumps(shuffle_options(correct_note, wrong_notes)),
+        'options': shuffle_options(correct_note, wrong_notes),
         'explanation': f'The {STRING_NAMES[string_num]} string open is {STRING_NAMES[string_num]}. '
                       f'Adding {fret} frets gives you {correct_note}.',
         'difficulty': difficulty,
@@ -141,38 +179,38 @@ def generate_chord_tones_quiz(difficulty):
     elif difficulty <= 3:
         chord_types = ['major', 'minor', 'diminished', 'augmented', 'sus2', 'sus4']
     else:
-        chord_types = list(CHORD_FORMULAS.keys())
+        chord_types = CHORD_TYPES_ALL
     
-    chord_type = random.choice(chord_types)
-    root = random.choice(NOTES[:7] if difficulty <= 2 else NOTES)  # Natural notes for easier difficulty
+    chord_type = _choice(chord_types)
+    root = _choice(NOTES[:7] if difficulty <= 2 else NOTES)  # Natural notes for easier difficulty
     
     correct_notes = get_chord_notes(root, chord_type)
-    correct_answer = ' '.join(correct_notes)
+    correct_answer = CHORD_NOTES_STR[(root, chord_type)]
     
     # Generate wrong options with plausible mistakes
     wrong_options = []
     
     # Wrong option 1: One note off
-    wrong1 = correct_notes.copy()
-    idx_to_change = random.randint(1, len(wrong1) - 1)  # Don't change root
-    wrong1[idx_to_change] = get_note_at_index(get_note_index(wrong1[idx_to_change]) + random.choice([-1, 1]))
+    wrong1 = list(correct_notes)
+    idx_to_change = _randint(1, len(wrong1) - 1)  # Don't change root
+    wrong1[idx_to_change] = get_note_at_index(get_note_index(wrong1[idx_to_change]) + _choice([-1, 1]))
     wrong_options.append(' '.join(wrong1))
     
     # Wrong option 2: Different chord type
     other_types = [t for t in chord_types if t != chord_type]
     if other_types:
-        other_type = random.choice(other_types)
-        wrong_options.append(' '.join(get_chord_notes(root, other_type)))
+        other_type = _choice(other_types)
+        wrong_options.append(CHORD_NOTES_STR[(root, other_type)])
     
     # Wrong option 3: Wrong root
-    wrong_root = get_note_at_index(get_note_index(root) + random.choice([1, 2]))
-    wrong_options.append(' '.join(get_chord_notes(wrong_root, chord_type)))
+    wrong_root = get_note_at_index(get_note_index(root) + _choice([1, 2]))
+    wrong_options.append(CHORD_NOTES_STR[(wrong_root, chord_type)])
     
     # Ensure we have 3 unique wrong options
-    wrong_options = list(set(wrong_options))[:3]
+    wrong_options = unique_wrong_options(wrong_options, correct_answer)
     while len(wrong_options) < 3:
-        wrong = correct_notes.copy()
-        random.shuffle(wrong)
+        wrong = list(correct_notes)
+        _shuffle(wrong)
         wrong_str = ' '.join(wrong)
         if wrong_str != correct_answer and wrong_str not in wrong_options:
             wrong_options.append(wrong_str)
@@ -184,7 +222,7 @@ def generate_chord_tones_quiz(difficulty):
         'title': 'Chord Tones',
         'question': f'Which notes are in a {chord_name} chord?',
         'correct_answer': correct_answer,
-        'options': json.dumps(shuffle_options(correct_answer, wrong_options[:3])),
+        'options': shuffle_options(correct_answer, wrong_options),
         'explanation': f'{chord_name} contains the notes {correct_answer}. '
                       f'Formula: {CHORD_FORMULAS[chord_type]}',
         'difficulty': difficulty,
@@ -201,24 +239,21 @@ def generate_interval_quiz(difficulty):
     else:
         max_interval = 12
     
-    semitones = random.randint(1, max_interval)
+    semitones = _randint(1, max_interval)
     correct_answer = INTERVALS[semitones]
     
     # Wrong options: nearby intervals
-    wrong_options = []
-    for offset in [-2, -1, 1, 2]:
-        wrong_semitones = semitones + offset
-        if 0 < wrong_semitones <= 12 and wrong_semitones != semitones:
-            wrong_options.append(INTERVALS[wrong_semitones])
-    
-    wrong_options = list(set(wrong_options))[:3]
+    wrong_options = unique_wrong_options(
+        (INTERVALS[semitones + offset] for offset in (-2, -1, 1, 2) if 0 < semitones + offset <= 12),
+        correct_answer,
+    )
     
     return {
         'type': 'interval',
         'title': 'Interval Knowledge',
         'question': f'What interval is {semitones} semitone{"s" if semitones != 1 else ""} (frets)?',
         'correct_answer': correct_answer,
-        'options': json.dumps(shuffle_options(correct_answer, wrong_options)),
+        'options': shuffle_options(correct_answer, wrong_options),
         'explanation': f'{semitones} semitones = {correct_answer}.',
         'difficulty': difficulty,
     }
@@ -226,14 +261,9 @@ def generate_interval_quiz(difficulty):
 
 def generate_interval_semitones_quiz(difficulty):
     """Generate a 'how many semitones in this interval' question."""
-    if difficulty <= 2:
-        intervals_subset = {k: v for k, v in INTERVALS.items() if k <= 7}
-    else:
-        intervals_subset = INTERVALS
-    
-    semitones = random.choice(list(intervals_subset.keys()))
+    semitones = _choice(INTERVAL_KEYS_EASY if difficulty <= 2 else INTERVAL_KEYS_ALL)
     if semitones == 0:
-        semitones = random.randint(1, 7)
+        semitones = _randint(1, 7)
     
     interval_name = INTERVALS[semitones]
     correct_answer = str(semitones)
@@ -250,7 +280,7 @@ def generate_interval_semitones_quiz(difficulty):
         'title': 'Interval Distance',
         'question': f'How many semitones (frets) are in a {interval_name}?',
         'correct_answer': correct_answer,
-        'options': json.dumps(shuffle_options(correct_answer, wrong_options[:3])),
+        'options': shuffle_options(correct_answer, wrong_options[:3]),
         'explanation': f'A {interval_name} is {semitones} semitones (frets).',
         'difficulty': difficulty,
     }
@@ -263,10 +293,10 @@ def generate_scale_notes_quiz(difficulty):
     elif difficulty <= 3:
         scale_types = ['major', 'natural minor', 'major pentatonic', 'minor pentatonic', 'blues', 'dorian']
     else:
-        scale_types = list(SCALE_FORMULAS.keys())
+        scale_types = SCALE_TYPES_ALL
     
-    scale_type = random.choice(scale_types)
-    root = random.choice(NOTES[:7] if difficulty <= 2 else NOTES)
+    scale_type = _choice(scale_types)
+    root = _choice(NOTES[:7] if difficulty <= 2 else NOTES)
     
     correct_notes = get_scale_notes(root, scale_type)
     correct_answer = ' '.join(correct_notes)
@@ -277,25 +307,25 @@ def generate_scale_notes_quiz(difficulty):
     # Different scale type
     other_types = [t for t in scale_types if t != scale_type]
     if other_types:
-        wrong_options.append(' '.join(get_scale_notes(root, random.choice(other_types))))
+        wrong_options.append(' '.join(get_scale_notes(root, _choice(other_types))))
     
     # One note wrong
-    wrong1 = correct_notes.copy()
-    idx = random.randint(1, len(wrong1) - 1)
+    wrong1 = list(correct_notes)
+    idx = _randint(1, len(wrong1) - 1)
     wrong1[idx] = get_note_at_index(get_note_index(wrong1[idx]) + 1)
     wrong_options.append(' '.join(wrong1))
     
     # Wrong root
     wrong_options.append(' '.join(get_scale_notes(get_note_at_index(get_note_index(root) + 1), scale_type)))
     
-    wrong_options = list(set(wrong_options))[:3]
+    wrong_options = unique_wrong_options(wrong_options, correct_answer)
     
     return {
         'type': 'scale_notes',
         'title': 'Scale Notes',
         'question': f'Which notes are in the {root} {scale_type} scale?',
         'correct_answer': correct_answer,
-        'options': json.dumps(shuffle_options(correct_answer, wrong_options)),
+        'options': shuffle_options(correct_answer, wrong_options),
         'explanation': f'The {root} {scale_type} scale contains: {correct_answer}.',
         'difficulty': difficulty,
     }
@@ -303,11 +333,11 @@ def generate_scale_notes_quiz(difficulty):
 
 def generate_key_signature_quiz(difficulty):
     """Generate a key signature question."""
-    keys = list(KEY_SIGNATURES.keys())
+    keys = KEY_SIGNATURE_KEYS
     if difficulty <= 2:
         keys = ['C', 'G', 'D', 'F', 'Bb']  # Common keys
     
-    key = random.choice(keys)
+    key = _choice(keys)
     sig = KEY_SIGNATURES[key]
     
     if sig == 0:
@@ -328,14 +358,14 @@ def generate_key_signature_quiz(difficulty):
         else:
             wrong_options.append(f'{abs(wrong_sig)} flat{"s" if abs(wrong_sig) != 1 else ""}')
     
-    wrong_options = [w for w in wrong_options if w != correct_answer][:3]
+    wrong_options = unique_wrong_options(wrong_options, correct_answer)
     
     return {
         'type': 'key_signature',
         'title': 'Key Signatures',
         'question': f'How many sharps or flats are in the key of {key} major?',
         'correct_answer': correct_answer,
-        'options': json.dumps(shuffle_options(correct_answer, wrong_options)),
+        'options': shuffle_options(correct_answer, wrong_options),
         'explanation': f'{key} major has {correct_answer.lower()}.',
         'difficulty': difficulty,
     }
@@ -347,7 +377,7 @@ def generate_relative_minor_quiz(difficulty):
     if difficulty <= 2:
         major_keys = ['C', 'G', 'D', 'F']
     
-    major_key = random.choice(major_keys)
+    major_key = _choice(major_keys)
     major_idx = get_note_index(major_key)
     
     # Relative minor is 3 semitones below (or 9 above)
@@ -367,7 +397,7 @@ def generate_relative_minor_quiz(difficulty):
         'title': 'Relative Minor',
         'question': f'What is the relative minor of {major_key} major?',
         'correct_answer': correct_answer,
-        'options': json.dumps(shuffle_options(correct_answer, wrong_options[:3])),
+        'options': shuffle_options(correct_answer, wrong_options[:3]),
         'explanation': f'The relative minor is 3 semitones below the major key. '
                       f'{major_key} major\'s relative minor is {correct_answer}.',
         'difficulty': difficulty,
@@ -376,10 +406,9 @@ def generate_relative_minor_quiz(difficulty):
 
 def generate_circle_of_fifths_quiz(difficulty):
     """Generate a circle of fifths question."""
-    direction = random.choice(['clockwise', 'counter-clockwise'])
-    start_key = random.choice(CIRCLE_OF_FIFTHS[:7])  # Natural keys
-    
-    start_idx = CIRCLE_OF_FIFTHS.index(start_key)
+    direction = _choice(['clockwise', 'counter-clockwise'])
+    start_idx = _randint(0, 6)  # Natural keys: the first seven positions
+    start_key = CIRCLE_OF_FIFTHS[start_idx]
     
     if direction == 'clockwise':
         next_idx = (start_idx + 1) % 12
@@ -403,7 +432,7 @@ def generate_circle_of_fifths_quiz(difficulty):
         'title': 'Circle of Fifths',
         'question': question,
         'correct_answer': correct_answer,
-        'options': json.dumps(shuffle_options(correct_answer, wrong_options[:3])),
+        'options': shuffle_options(correct_answer, wrong_options[:3]),
         'explanation': f'The circle of fifths goes: C-G-D-A-E-B-F#... (clockwise adds sharps). '
                       f'Counter-clockwise: C-F-Bb-Eb... (adds flats).',
         'difficulty': difficulty,
@@ -417,33 +446,23 @@ def generate_chord_formula_quiz(difficulty):
     elif difficulty <= 3:
         chord_types = ['major', 'minor', 'diminished', 'augmented', 'dominant 7th', 'major 7th', 'minor 7th']
     else:
-        chord_types = list(CHORD_FORMULAS.keys())
+        chord_types = CHORD_TYPES_ALL
     
-    chord_type = random.choice(chord_types)
-    formula = CHORD_FORMULAS[chord_type]
+    chord_type = _choice(chord_types)
+    correct_answer = CHORD_FORMULA_STR[chord_type]
     
-    # Convert to interval notation
-    interval_names = {
-        0: '1', 2: '2', 3: 'b3', 4: '3', 5: '4', 6: 'b5', 7: '5',
-        8: '#5', 9: '6', 10: 'b7', 11: '7', 14: '9'
-    }
-    correct_answer = '-'.join([interval_names.get(i, str(i)) for i in formula])
-    
-    # Wrong options
-    wrong_options = []
-    for other_type in chord_types:
-        if other_type != chord_type:
-            other_formula = CHORD_FORMULAS[other_type]
-            wrong = '-'.join([interval_names.get(i, str(i)) for i in other_formula])
-            if wrong != correct_answer:
-                wrong_options.append(wrong)
+    # Wrong options: the formulas of the other chords at this level
+    wrong_options = unique_wrong_options(
+        (CHORD_FORMULA_STR[other_type] for other_type in chord_types if other_type != chord_type),
+        correct_answer,
+    )
     
     return {
         'type': 'chord_formula',
         'title': 'Chord Formulas',
         'question': f'What is the formula for a {chord_type} chord?',
         'correct_answer': correct_answer,
-        'options': json.dumps(shuffle_options(correct_answer, wrong_options[:3])),
+        'options': shuffle_options(correct_answer, wrong_options),
         'explanation': f'A {chord_type} chord has the formula: {correct_answer}.',
         'difficulty': difficulty,
     }
@@ -451,8 +470,8 @@ def generate_chord_formula_quiz(difficulty):
 
 def generate_note_to_fret_quiz(difficulty):
     """Generate a 'find this note on this string' question."""
-    string_num = random.randint(1, 4)
-    target_note = random.choice(NOTES[:7] if difficulty <= 2 else NOTES)
+    string_num = _randint(1, 4)
+    target_note = _choice(NOTES[:7] if difficulty <= 2 else NOTES)
     
     # Find the fret for this note on this string
     open_note_idx = BASS_STRINGS[string_num]
@@ -462,15 +481,14 @@ def generate_note_to_fret_quiz(difficulty):
     correct_answer = str(fret)
     
     # Wrong options
-    wrong_options = [str((fret + offset) % 12) for offset in [-2, -1, 1, 2]]
-    wrong_options = [w for w in wrong_options if w != correct_answer][:3]
+    wrong_options = unique_wrong_options((str((fret + offset) % 12) for offset in (-2, -1, 1, 2)), correct_answer)
     
     return {
         'type': 'note_to_fret',
         'title': 'Find the Note',
         'question': f'At which fret would you find {target_note} on the {STRING_NAMES[string_num]} string?',
         'correct_answer': correct_answer,
-        'options': json.dumps(shuffle_options(correct_answer, wrong_options)),
+        'options': shuffle_options(correct_answer, wrong_options),
         'explanation': f'{target_note} is at fret {fret} on the {STRING_NAMES[string_num]} string.',
         'difficulty': difficulty,
         'string_number': string_num,
@@ -518,13 +536,13 @@ def generate_rhythm_quiz(difficulty):
         },
     ]
     
-    q = random.choice(questions)
+    q = _choice(questions)
     return {
         'type': 'rhythm',
         'title': 'Rhythm & Time',
         'question': q['question'],
         'correct_answer': q['correct'],
-        'options': json.dumps(shuffle_options(q['correct'], q['wrong'])),
+        'options': shuffle_options(q['correct'], q['wrong']),
         'explanation': q['explanation'],
         'difficulty': difficulty,
     }
@@ -571,13 +589,13 @@ def generate_technique_quiz(difficulty):
         },
     ]
     
-    q = random.choice(questions)
+    q = _choice(questions)
     return {
         'type': 'technique',
         'title': 'Bass Technique',
         'question': q['question'],
         'correct_answer': q['correct'],
-        'options': json.dumps(shuffle_options(q['correct'], q['wrong'])),
+        'options': shuffle_options(q['correct'], q['wrong']),
         'explanation': q['explanation'],
         'difficulty': difficulty,
     }
@@ -620,7 +638,7 @@ def generate_quiz(quiz_category, difficulty=1):
     
     # Pick a random quiz type from the category
     quiz_types = QUIZ_CATEGORIES[quiz_category]
-    quiz_type = random.choice(quiz_types)
+    quiz_type = _choice(quiz_types)
     
     generator = QUIZ_GENERATORS.get(quiz_type)
     if not generator:
@@ -19,7 +19,10 @@ def ear_training():
     accuracy = (correct_attempts / total_attempts * 100) if total_attempts > 0 else 0
     
     # Get recent results
-    recent_results = EarTrainingResult.query.filter_by(exercise_id=0).order_by(
+    recent_results = EarTrainingResult.query.filter_by(exercise_id=0).options(
+        db.joinedload(EarTrainingResult.exercise),
+        db.raiseload('*'),
+    ).order_by(
         EarTrainingResult.practiced_at.desc()
     ).limit(10).all()
     
@@ -67,10 +70,10 @@ def get_ear_training_exercise():
     exercise_id = str(uuid.uuid4())
     
     _ear_training_cache[exercise_id] = {
-        'correct_answer': exercise_data['correct_answer'],
+        'correct_answer': exercise_data.correct_answer,
         'exercise_type': exercise_type,
         'difficulty': difficulty,
-        'root_note': exercise_data.get('root_note', 'C'),
+        'root_note': exercise_data.root_note,
     }
     
     if len(_ear_training_cache) > 100:
@@ -80,12 +83,12 @@ def get_ear_training_exercise():
     
     return jsonify({
         'id': exercise_id,
-        'type': exercise_data['type'],
-        'title': exercise_data['title'],
-        'description': exercise_data['description'],
-        'options': exercise_data['options'],
-        'root_note': exercise_data['root_note'],
-        'hints': exercise_data['hints'],
+        'type': exercise_data.type,
+        'title': exercise_data.title,
+        'description': exercise_data.description,
+        'options': exercise_data.options,
+        'root_note': exercise_data.root_note,
+        'hints': exercise_data.hints,
         'difficulty': difficulty
     })
 
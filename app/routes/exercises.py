@@ -1,3 +1,4 @@
+import json
 from flask import Blueprint, render_template, request, redirect, url_for, jsonify
 from ..models import db, Exercise, DynamicExercise, Progress
 from ..exercise_generator import generate_exercise, EXERCISE_CATEGORIES
@@ -21,7 +22,11 @@ def exercises():
     if search:
         query = query.filter(Exercise.title.ilike(f'%{search}%'))
     
-    exercises = query.order_by(Exercise.category, Exercise.difficulty_level).all()
+    # Only the columns the exercise cards show; instructions, tips etc. stay unloaded
+    exercises = query.options(db.load_only(
+        Exercise.title, Exercise.category, Exercise.difficulty_level,
+        Exercise.estimated_duration, Exercise.description,
+    )).order_by(Exercise.category, Exercise.difficulty_level).all()
     
     # Get unique categories for filter
     categories = db.session.query(Exercise.category).distinct().all()
@@ -140,7 +145,7 @@ def get_recommended_exercise():
         key_signature=exercise_data.get('key', ''),
         tempo_bpm=exercise_data.get('tempo', 80),
         tab_notation=exercise_data.get('tab', ''),
-        notes_data=str(exercise_data.get('notes', [])),
+        notes_data=json.dumps(exercise_data.get('notes', [])),
     )
     db.session.add(dynamic_exercise)
     db.session.commit()
@@ -49,9 +49,14 @@ def practice_session(session_id):
     session = PracticeSession.query.get_or_404(session_id)
     profile = UserProfile.query.first()
     
-    # Get session exercises with exercise details
+    # Get session exercises with exercise details; any other relationship
+    # the template touches raises instead of lazily querying per row
     session_exercises = SessionExercise.query.filter_by(
         session_id=session_id
+    ).options(
+        db.joinedload(SessionExercise.exercise),
+        db.joinedload(SessionExercise.dynamic_exercise),
+        db.raiseload('*'),
     ).order_by(SessionExercise.order_index).all()
     
     return render_template('practice.html',
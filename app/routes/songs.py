@@ -26,7 +26,12 @@ def songs():
             )
         )
     
-    songs = query.order_by(Song.mastery_level, Song.title).all()
+    # Only the columns the song cards show; bass notes, chords and notes stay unloaded
+    songs = query.options(db.load_only(
+        Song.title, Song.artist, Song.genre, Song.difficulty_level, Song.key_signature,
+        Song.tempo_bpm, Song.youtube_url, Song.mastery_level, Song.last_practiced,
+        Song.practice_count,
+    )).order_by(Song.mastery_level, Song.title).all()
     
     # Get daily playlist
     playlist = generate_daily_song_playlist()
@@ -14,13 +14,17 @@ _timing_cache = {}
 @bp.route('/timing')
 def timing_practice():
     """Timing practice main page with game selection."""
-    # Get high scores for each game mode
-    high_scores = {}
-    for mode in GAME_MODES.keys():
-        best = TimingHighScore.query.filter_by(game_mode=mode).order_by(
-            TimingHighScore.high_score.desc()
-        ).first()
-        high_scores[mode] = best
+    # Get high scores for each game mode in one query: the rows matching the
+    # best score per mode (ties keep the oldest row)
+    best = db.session.query(
+        TimingHighScore.game_mode, db.func.max(TimingHighScore.high_score).label('high_score')
+    ).filter(TimingHighScore.game_mode.in_(tuple(GAME_MODES))).group_by(TimingHighScore.game_mode).subquery()
+    high_scores = dict.fromkeys(GAME_MODES)
+    for score in TimingHighScore.query.join(best, db.and_(
+        TimingHighScore.game_mode == best.c.game_mode,
+        TimingHighScore.high_score == best.c.high_score,
+    )).order_by(TimingHighScore.id.desc()):
+        high_scores[score.game_mode] = score
     
     # Get recent sessions
     recent_sessions = TimingSession.query.order_by(
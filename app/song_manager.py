@@ -17,7 +17,8 @@ def generate_daily_song_playlist(max_songs=5):
     Generate a playlist of songs to practice based on user's song library
     and practice patterns.
     """
-    all_songs = Song.query.all()
+    # Playlists only show title, artist and mastery
+    all_songs = Song.query.options(db.load_only(Song.title, Song.artist, Song.mastery_level)).all()
     
     if not all_songs:
         return []
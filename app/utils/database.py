@@ -40,7 +40,8 @@ def update_progress_for_category(category, duration_minutes=0):
     # Get or create progress entry for this category
     progress = Progress.query.filter_by(category=category).first()
     if not progress:
-        progress = Progress(category=category)
+        # Column defaults only apply at flush, so start the counters explicitly
+        progress = Progress(category=category, exercises_completed=0, total_practice_time=0)
         db.session.add(progress)
     
     # Update exercise count and practice time
@@ -49,13 +50,8 @@ def update_progress_for_category(category, duration_minutes=0):
     if duration_minutes:
         progress.total_practice_time += duration_minutes
     
-    # Calculate skill_level based on exercises completed
-    # Formula: skill_level = 1 - (1 / (1 + exercises / 10))
-    exercises = progress.exercises_completed
-    if exercises <= 0:
-        progress.skill_level = 0.0
-    else:
-        progress.skill_level = min(1.0, 1.0 - (1.0 / (1.0 + exercises / 10.0)))
+    # Derived in the same UPDATE as the counters, from the model's single formula
+    progress.update_skill_level()
     
     db.session.commit()
     return progress
@@ -1,29 +1,39 @@
 """
 Common music theory utility functions for the bass practice application.
 """
+from ..config.settings import NOTES, NOTES_FLAT
 
-# Constants needed for utilities (will be move to config later)
-NOTES = ['C', 'C#', 'D', 'D#', 'E', 'F', 'F#', 'G', 'G#', 'A', 'A#', 'B']
-NOTES_FLAT = ['C', 'Db', 'D', 'Eb', 'E', 'F', 'Gb', 'G', 'Ab', 'A', 'Bb', 'B']
+# Note name -> index (0-11) for both sharp and flat spellings
+NOTE_INDEX = {**{n: i for i, n in enumerate(NOTES_FLAT)}, **{n: i for i, n in enumerate(NOTES)}}
+
+# Note names by pitch class (0-11)
+SHARP_NAMES = tuple(NOTES)
+FLAT_NAMES = tuple(NOTES_FLAT)
+
+# Keys conventionally spelled with flats
+FLAT_KEYS = frozenset(['F', 'Bb', 'Eb', 'Ab', 'Db', 'Gb'])
+
+# Whether notes built on a root are spelled with flats, for every root spelling
+_USE_FLATS = {note: note in FLAT_KEYS or 'b' in note for note in NOTE_INDEX}
 
 def note_to_index(note):
     """Get the index (0-11) of a note."""
-    if note in NOTES:
-        return NOTES.index(note)
-    if note in NOTES_FLAT:
-        return NOTES_FLAT.index(note)
-    return 0
+    return NOTE_INDEX.get(note, 0)
+
+def use_flats_for(root):
+    """Whether notes built on this root should be spelled with flats."""
+    use_flats = _USE_FLATS.get(root)
+    return 'b' in root if use_flats is None else use_flats
 
 def index_to_note(index, use_flats=False):
     """Get note name at given index (0-11), wrapping around."""
-    index = index % 12
-    return NOTES_FLAT[index] if use_flats else NOTES[index]
+    return (FLAT_NAMES if use_flats else SHARP_NAMES)[index % 12]
 
 def transpose_note(note, semitones, use_flats=None):
     """Transpose a note by a number of semitones."""
     current_idx = note_to_index(note)
     if use_flats is None:
-        use_flats = 'b' in note or note in ['F', 'Bb', 'Eb', 'Ab', 'Db', 'Gb']
+        use_flats = use_flats_for(note)
     return index_to_note(current_idx + semitones, use_flats)
 
 def get_interval_name(semitones):
@@ -0,0 +1,50 @@
+"""
+Tests for the exercise generators.
+"""
+import random
+import pytest
+from app.generators.utils import clamp_difficulty, pick_tempo
+from app.generators import scales, arpeggios, rhythms, technique, theory
+
+SUFFIX_TABLES = (
+    scales._SCALE_SUFFIX, scales._CHROMATIC_SUFFIX, arpeggios._ARP_SUFFIX,
+    rhythms._PROG_SUFFIX, rhythms._RHYTHM_SUFFIX, technique._FINGER_SUFFIX,
+    theory._INTERVAL_SUFFIX,
+)
+
+
+@pytest.mark.parametrize('difficulty, expected', [(-10, 0), (-1, 0), (0, 0), (3, 3), (5, 5), (9, 5)])
+def test_clamp_difficulty(difficulty, expected):
+    assert clamp_difficulty(difficulty) == expected
+
+
+@pytest.mark.parametrize('difficulty', [-10, -1, 0])
+def test_no_extra_instructions_below_difficulty_one(difficulty):
+    for suffixes in SUFFIX_TABLES:
+        assert suffixes[clamp_difficulty(difficulty)] == ''
+
+
+@pytest.mark.parametrize('difficulty', [-10, 0, 6])
+def test_pick_tempo_outside_table_uses_default_range(difficulty):
+    for _ in range(50):
+        tempo = pick_tempo(difficulty)
+        assert 60 <= tempo <= 100 and tempo % 5 == 0
+
+
+GENERATORS = (
+    scales.generate_scale_exercise, scales.generate_chromatic_exercise,
+    arpeggios.generate_arpeggio_exercise, rhythms.generate_chord_progression_exercise,
+    rhythms.generate_rhythm_exercise, technique.generate_technique_exercise,
+    technique.generate_finger_exercise, theory.generate_interval_exercise,
+)
+
+
+@pytest.mark.parametrize('generator', GENERATORS)
+@pytest.mark.parametrize('difficulty', [-10, -1])
+def test_negative_difficulty_matches_zero(generator, difficulty):
+    random.seed(42)
+    negative = generator(difficulty)
+    random.seed(42)
+    zero = generator(0)
+    assert negative['instructions'] == zero['instructions']
+    assert negative.get('tab') == zero.get('tab')
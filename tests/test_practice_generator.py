@@ -0,0 +1,42 @@
+"""
+Tests for practice session generation.
+"""
+import pytest
+from flask import Flask
+from sqlalchemy import event
+from app.models import db, SessionExercise
+from app.practice_generator import generate_practice_session
+
+
+@pytest.fixture
+def app():
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite://'
+    db.init_app(app)
+    with app.app_context():
+        db.create_all()
+        yield app
+
+
+def test_generate_practice_session_batches_inserts(app):
+    statements = []
+    
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+    
+    event.listen(db.engine, 'before_cursor_execute', record)
+    try:
+        session = generate_practice_session(3, 60)
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', record)
+    
+    inserts = [s for s in statements if s.startswith('INSERT')]
+    assert [s.split()[2] for s in inserts] == ['practice_sessions', 'dynamic_exercises', 'session_exercises']
+    assert len(statements) <= 6
+    
+    links = db.session.scalars(
+        db.select(SessionExercise).filter_by(session_id=session.id).order_by(SessionExercise.order_index)
+    ).all()
+    assert len(links) == session.total_exercises > 0
+    for link in links:
+        assert link.dynamic_exercise.estimated_duration == link.planned_duration